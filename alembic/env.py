@@ -12,7 +12,7 @@ from alembic import context
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from app.adapters.db.models import Base
-from app.config.settings import Settings
+from app.config.settings import get_settings
 
 config = context.config
 if config.config_file_name is not None:
@@ -21,7 +21,7 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 def get_url() -> str:
-    return Settings().database_url
+    return get_settings().database_url
 
 def run_migrations_offline() -> None:
     url = get_url()
@@ -0,0 +1,27 @@
+"""Store event categories as text[] instead of a comma-joined string
+Revision ID: 3f1c2a7b9d04
+Revises: 885d70cbecd3
+Create Date: 2026-10-15 09:12:41.118204
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '3f1c2a7b9d04'
+down_revision = '885d70cbecd3'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.alter_column('events', 'categories',
+               existing_type=sa.String(length=300),
+               type_=postgresql.ARRAY(sa.String()),
+               existing_nullable=True,
+               postgresql_using="string_to_array(categories, ',')")
+
+def downgrade() -> None:
+    op.alter_column('events', 'categories',
+               existing_type=postgresql.ARRAY(sa.String()),
+               type_=sa.String(length=300),
+               existing_nullable=True,
+               postgresql_using="array_to_string(categories, ',')")
@@ -11,7 +11,7 @@ The Planning Agent is the "brain" that:
 from typing import List
 
 from pydantic_ai import Agent, RunContext
-from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic import BaseModel
 
 from app.core.domain.agent_models import (
@@ -78,7 +78,7 @@ class PlanningAgent(PlanningAgentPort):
         
         # Create PydanticAI agent for reasoning
         self.reasoning_agent = Agent(
-            model=OpenAIModel(model),
+            model=OpenAIChatModel(model),
             system_prompt=self._get_system_prompt(),
             retries=2
         )
@@ -226,9 +226,8 @@ Always provide clear reasoning for your decisions.
         seen_titles = set()
         unique_events = []
         for event in all_events:
-            title_lower = event.title.lower()
-            if title_lower not in seen_titles:
-                seen_titles.add(title_lower)
+            if event.title_key not in seen_titles:
+                seen_titles.add(event.title_key)
                 unique_events.append(event)
         
         state.events_found = unique_events
@@ -456,7 +455,7 @@ Always provide clear reasoning for your decisions.
         
         # Summary statistics
         total_entities = sum(len(er.entities) for er in events_researched)
-        total_facts = sum(len(r.facts) for r in sum([er.results for er in events_researched], []))
+        total_facts = sum(er.total_facts for er in events_researched)
         avg_confidence = sum(er.overall_confidence for er in events_researched) / len(events_researched) if events_researched else 0
         
         state.add_observation(
@@ -8,7 +8,7 @@ from jinja2 import Environment, FileSystemLoader
 import os
 
 from pydantic_ai import Agent
-from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.models.openai import OpenAIChatModel
 
 from app.core.domain.agent_models import (
     EnrichedEvent,
@@ -29,7 +29,7 @@ class PromoGeneratorAgent(PromoAgentPort):
         import os
         os.environ["OPENAI_API_KEY"] = api_key
         self.agent = Agent(
-            model=OpenAIModel(model),
+            model=OpenAIChatModel(model),
             system_prompt=(
                 "You are a LEGENDARY wrestling promo generator. "
                 "You channel the energy of Macho Man Randy Savage and Ultimate Warrior. "
@@ -101,7 +101,7 @@ class PromoGeneratorAgent(PromoAgentPort):
                     # Add research narrative and insights to the event item
                     item["research_narrative"] = research.synthesized_narrative
                     item["research_insights"] = research.key_insights[:5]
-                    item["research_facts_count"] = sum(len(r.facts) for r in research.results)
+                    item["research_facts_count"] = research.total_facts
                 else:
                     item["research_narrative"] = ""
                     item["research_insights"] = []
@@ -5,12 +5,12 @@ The /r/houston community maintains a weekly "Things to do" thread that's
 a goldmine of local events. This agent scrapes those threads.
 """
 import time
-import httpx
 from typing import List
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from bs4 import BeautifulSoup
 
+from app.adapters.scraping.http_client import get_client
 from app.core.domain.models import Event
 from app.core.domain.agent_models import SearchAgentResult
 from app.core.ports.agent_port import SearchAgentPort
@@ -28,13 +28,11 @@ class RedditEventsAgent(SearchAgentPort):
     """
     
     def __init__(self):
-        self.client = httpx.AsyncClient(
-            timeout=15,
-            follow_redirects=True,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
-        )
+        self.client = get_client()
+        # Reddit rejects the default httpx User-Agent, so send a browser one per request
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+        }
     
     def get_agent_name(self) -> str:
         return "Reddit r/houston"
@@ -86,7 +84,7 @@ class RedditEventsAgent(SearchAgentPort):
         
         try:
             # Fetch the page
-            response = await self.client.get(url)
+            response = await self.client.get(url, headers=self.headers, follow_redirects=True)
             
             if response.status_code != 200:
                 return []
@@ -244,6 +242,5 @@ class RedditEventsAgent(SearchAgentPort):
         return now + timedelta(days=days_until_saturday)
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """No-op: the shared HTTP client is closed by close_client() at shutdown."""
 
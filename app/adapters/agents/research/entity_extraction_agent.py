@@ -1,10 +1,10 @@
 """Entity extraction agent implementation."""
 from typing import List
 from pydantic_ai import Agent
-from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.models.openai import OpenAIChatModel
 
 from app.core.domain.models import Event
-from app.core.domain.research_models import Entity
+from app.core.domain.research_models import ALL_ENTITY_TYPES, Entity
 from app.core.ports.research_port import EntityExtractionPort
 
 
@@ -19,7 +19,7 @@ class EntityExtractionAgent(EntityExtractionPort):
         os.environ["OPENAI_API_KEY"] = openai_api_key
         
         self.agent = Agent(
-            model=OpenAIModel("gpt-5-nano-2025-08-07"),
+            model=OpenAIChatModel("gpt-5-nano-2025-08-07"),
             system_prompt=self._get_system_prompt()
         )
     
@@ -100,8 +100,7 @@ Extract ALL relevant entities from this event.
                 type_str = parts[1].replace('TYPE:', '').strip().lower()
                 
                 # Validate type
-                valid_types = ['artist', 'venue', 'organizer', 'topic', 'genre']
-                if type_str not in valid_types:
+                if type_str not in ALL_ENTITY_TYPES:
                     type_str = 'topic'  # Default fallback
                 
                 context = parts[2].replace('CONTEXT:', '').strip() if len(parts) > 2 else ""
@@ -1,7 +1,8 @@
 """Knowledge synthesis agent - combines research into narratives."""
+from itertools import chain, islice
 from typing import List
 from pydantic_ai import Agent
-from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.models.openai import OpenAIChatModel
 
 from app.core.domain.models import Event
 from app.core.domain.research_models import Entity, ResearchResult, EventResearch
@@ -23,7 +24,7 @@ class KnowledgeSynthesisAgent(KnowledgeSynthesisPort):
         os.environ["OPENAI_API_KEY"] = openai_api_key
         
         self.agent = Agent(
-            model=OpenAIModel("gpt-5.2-2025-12-11"),
+            model=OpenAIChatModel("gpt-5.2-2025-12-11"),
             system_prompt=self._get_system_prompt()
         )
     
@@ -58,16 +59,9 @@ Write in an engaging, slightly dramatic style that works for a wrestling promo!
     ) -> EventResearch:
         """Synthesize all research into a narrative."""
         
-        # Aggregate all facts
-        all_facts = []
-        all_sources = []
-        
-        for result in research_results:
-            all_facts.extend(result.facts)
-            all_sources.extend(result.sources)
-        
-        # Deduplicate facts (simple approach)
-        unique_facts = list(dict.fromkeys(all_facts))[:15]  # Top 15 unique facts
+        # Aggregate and deduplicate facts in one pass (simple approach)
+        all_facts = chain.from_iterable(result.facts for result in research_results)
+        unique_facts = list(islice(dict.fromkeys(all_facts), 15))  # Top 15 unique facts
         
         if not unique_facts:
             # No research data, create basic narrative
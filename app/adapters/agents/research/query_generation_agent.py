@@ -1,8 +1,8 @@
 """Query Generation Agent - Generates targeted research queries using PydanticAI."""
 from typing import List
 from pydantic_ai import Agent
-from pydantic_ai.models.openai import OpenAIModel
-import json
+from pydantic_ai.models.openai import OpenAIChatModel
+import orjson
 
 from app.core.domain.models import Event
 from app.core.domain.research_models import Entity, ResearchQuery
@@ -18,7 +18,7 @@ class QueryGenerationAgent(QueryGenerationPort):
         os.environ["OPENAI_API_KEY"] = openai_api_key
         
         self.agent = Agent(
-            model=OpenAIModel(model),
+            model=OpenAIChatModel(model),
             system_prompt="""You are an expert research query generator for event information.
 
 Your task is to analyze an event and its extracted entities, then generate SPECIFIC, TARGETED research queries that will gather the most valuable information for enriching a wrestling-style event promo.
@@ -103,7 +103,7 @@ OUTPUT FORMAT (JSON):
         # Detect if this is a music event
         categories = getattr(event, 'categories', []) or []
         is_music_event = 'music' in categories or any(
-            keyword in event.title.lower() 
+            keyword in event.title_lower
             for keyword in ['concert', 'tour', 'show', 'live music', 'orchestra', 'band', 'singer', 'rapper', 'dj']
         )
         
@@ -149,7 +149,7 @@ Prioritize quality over quantity - each query should be high-impact!
                 json_end = response_text.rfind('}') + 1
                 if json_start >= 0 and json_end > json_start:
                     json_str = response_text[json_start:json_end]
-                    data = json.loads(json_str)
+                    data = orjson.loads(json_str)
                 else:
                     raise ValueError("No JSON found in response")
                 
@@ -173,7 +173,7 @@ Prioritize quality over quantity - each query should be high-impact!
                 
                 return queries
                 
-            except (json.JSONDecodeError, ValueError, KeyError) as parse_error:
+            except (orjson.JSONDecodeError, ValueError, KeyError) as parse_error:
                 print(f"⚠️  Failed to parse query generation response: {parse_error}")
                 return self._generate_fallback_queries(event, entities)
             
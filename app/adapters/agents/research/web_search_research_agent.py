@@ -1,8 +1,9 @@
 """Web search research agent using SerpAPI."""
 import time
-import httpx
+import orjson
 from typing import List
 
+from app.adapters.scraping.http_client import get_client
 from app.core.domain.research_models import ResearchQuery, ResearchResult
 from app.core.ports.research_port import ResearchAgentPort
 
@@ -15,7 +16,7 @@ class WebSearchResearchAgent(ResearchAgentPort):
     
     def __init__(self, serpapi_key: str):
         self.serpapi_key = serpapi_key
-        self.client = httpx.AsyncClient(timeout=15)
+        self.client = get_client()
         self.base_url = "https://serpapi.com/search"
     
     def get_agent_id(self) -> str:
@@ -61,7 +62,7 @@ class WebSearchResearchAgent(ResearchAgentPort):
                     execution_time=time.time() - start_time
                 )
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Check for SerpAPI errors
             if "error" in data:
@@ -131,6 +132,5 @@ class WebSearchResearchAgent(ResearchAgentPort):
             )
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """No-op: the shared HTTP client is closed by close_client() at shutdown."""
 
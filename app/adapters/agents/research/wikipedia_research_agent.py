@@ -1,8 +1,9 @@
 """Wikipedia research agent implementation."""
 import time
-import httpx
+import orjson
 from typing import List
 
+from app.adapters.scraping.http_client import get_client
 from app.core.domain.research_models import ResearchQuery, ResearchResult
 from app.core.ports.research_port import ResearchAgentPort
 
@@ -14,7 +15,7 @@ class WikipediaResearchAgent(ResearchAgentPort):
     """
     
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=15)
+        self.client = get_client()
         self.base_url = "https://en.wikipedia.org/api/rest_v1/page/summary"
     
     def get_agent_id(self) -> str:
@@ -52,7 +53,7 @@ class WikipediaResearchAgent(ResearchAgentPort):
                 response = await self.client.get(url)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     
                     # Extract info
                     title = data.get("title", "")
@@ -98,6 +99,5 @@ class WikipediaResearchAgent(ResearchAgentPort):
         return sentences[:5]
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """No-op: the shared HTTP client is closed by close_client() at shutdown."""
 
@@ -4,15 +4,17 @@ Each agent can validate/enrich events independently.
 """
 import asyncio
 from typing import List, Optional
-import httpx
+import orjson
 from bs4 import BeautifulSoup
 from datetime import datetime
 
 from app.core.domain.models import Event
+from app.core.domain.services import SCORE_LUT, classify
 from app.core.domain.agent_models import ReviewAgentResult, EnrichedEvent
 from app.core.ports.agent_port import ReviewAgentPort
+from app.adapters.scraping.http_client import get_client
 from pydantic_ai import Agent
-from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.models.openai import OpenAIChatModel
 
 
 class WebSearchEnricherAgent(ReviewAgentPort):
@@ -23,13 +25,12 @@ class WebSearchEnricherAgent(ReviewAgentPort):
     
     def __init__(self, serpapi_key: str, openai_api_key: str):
         self.serpapi_key = serpapi_key
-        self.client = httpx.AsyncClient(timeout=15, follow_redirects=True)
         
         # Set up LLM agent for synthesizing search results
         import os
         os.environ["OPENAI_API_KEY"] = openai_api_key
         self.llm_agent = Agent(
-            model=OpenAIModel("gpt-5-nano-2025-08-07"),
+            model=OpenAIChatModel("gpt-5-nano-2025-08-07"),
             system_prompt=(
                 "You are an event information verifier. Given search results about an event, "
                 "extract and verify key details: venue, date/time, price, description. "
@@ -68,7 +69,8 @@ class WebSearchEnricherAgent(ReviewAgentPort):
                 "api_key": self.serpapi_key
             }
             
-            response = await self.client.get(search_url, params=params)
+            # Shared pooled client: the swarm's concurrent reviews reuse warm connections
+            response = await get_client().get(search_url, params=params, timeout=15, follow_redirects=True)
             if response.status_code != 200:
                 return ReviewAgentResult(
                     agent_id="web_search_enricher",
@@ -82,7 +84,7 @@ class WebSearchEnricherAgent(ReviewAgentPort):
                     checks_performed=checks
                 )
             
-            data = response.json()
+            data = orjson.loads(response.content)
             organic_results = data.get("organic_results", [])
             
             if not organic_results:
@@ -172,8 +174,7 @@ Keep it brief (2-3 sentences).
             )
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """No-op: the shared HTTP client is closed by close_client() at shutdown."""
 
 
 class ContentEnricherAgent(ReviewAgentPort):
@@ -183,13 +184,12 @@ class ContentEnricherAgent(ReviewAgentPort):
     """
     
     def __init__(self, openai_api_key: str, model: str = "gpt-5-nano-2025-08-07"):
-        self.client = httpx.AsyncClient(timeout=10, follow_redirects=True)
-        # PydanticAI OpenAIModel picks up API key from OPENAI_API_KEY env var
+        # PydanticAI OpenAIChatModel picks up API key from OPENAI_API_KEY env var
         # or pass it in the format: "openai:model_name"
         import os
         os.environ["OPENAI_API_KEY"] = openai_api_key
         self.llm_agent = Agent(
-            model=OpenAIModel(model),
+            model=OpenAIChatModel(model),
             system_prompt=(
                 "You are an event detail extractor. Given HTML content from an event page, "
                 "extract key information like exact date/time, venue details, price, "
@@ -216,7 +216,7 @@ class ContentEnricherAgent(ReviewAgentPort):
         
         try:
             # Fetch the page
-            response = await self.client.get(str(event.url))
+            response = await get_client().get(str(event.url), timeout=10, follow_redirects=True)
             if response.status_code != 200:
                 return ReviewAgentResult(
                     agent_id="content_enricher",
@@ -287,8 +287,7 @@ Keep it concise and factual.
             )
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """No-op: the shared HTTP client is closed by close_client() at shutdown."""
 
 
 class RelevanceScoreAgent(ReviewAgentPort):
@@ -297,45 +296,25 @@ class RelevanceScoreAgent(ReviewAgentPort):
     Uses domain knowledge about cycling, couple activities, etc.
     """
     
-    # Import scoring keywords from domain
-    CYCLING = ["cycling", "bike", "biking", "bicycle", "mtb", "ride", "critical mass"]
-    OUTDOOR = ["outdoor", "park", "hike", "trail", "run", "nature", "bayou", "memorial park", "kayak", "paddle"]
-    MUSIC = ["music", "concert", "band", "live music", "dj", "show", "performance", "venue"]
-    DOG_FRIENDLY = ["dog", "dog-friendly", "pet", "pet-friendly", "pup", "canine", "bark", "dogs welcome"]
-    COUPLE_ACTIVITIES = ["wine", "brewery", "beer", "cocktail", "tasting", "comedy", "trivia", "art walk", "gallery", "date night", "romantic"]
-    KID_FOCUSED = ["kids", "children", "family fun", "toddler", "playground", "bounce house", "story time", "baby"]
+    # Note per SCORE_WEIGHTS row (bit i of the category mask)
+    CATEGORY_NOTES = (
+        "High priority: Cycling event",
+        "High priority: Couple-friendly activity",
+        "Music/concert event",
+        "Dog-friendly event",
+        "Outdoor activity",
+        "Kid-focused event (deprioritized)",
+    )
     
     async def review_event(self, event: Event) -> ReviewAgentResult:
         """Score the event for relevance."""
         checks = ["relevance_scoring"]
         
-        text = f"{event.title} {event.description or ''}".lower()
-        score = 0
-        notes = []
-        
-        if any(k in text for k in self.CYCLING):
-            score += 10
-            notes.append("High priority: Cycling event")
-        
-        if any(k in text for k in self.COUPLE_ACTIVITIES):
-            score += 9
-            notes.append("High priority: Couple-friendly activity")
-        
-        if any(k in text for k in self.MUSIC):
-            score += 8
-            notes.append("Music/concert event")
-        
-        if any(k in text for k in self.DOG_FRIENDLY):
-            score += 7
-            notes.append("Dog-friendly event")
-        
-        if any(k in text for k in self.OUTDOOR):
-            score += 5
-            notes.append("Outdoor activity")
-        
-        if any(k in text for k in self.KID_FOCUSED):
-            score -= 5
-            notes.append("Kid-focused event (deprioritized)")
+        # Same categories and weights as prioritize_events; classify() is memoized per text,
+        # so events that recur across sources and runs aren't rescanned
+        mask = classify(event)
+        score = SCORE_LUT[mask]
+        notes = [note for i, note in enumerate(self.CATEGORY_NOTES) if mask >> i & 1]
         
         # Confidence based on how well we can categorize
         confidence = min(1.0, (len(notes) * 0.25) + 0.5)
@@ -4,78 +4,149 @@ Each agent specializes in a specific data source.
 
 NOTE: Eventbrite removed - they deprecated public event search in 2019-2020.
 """
+import asyncio
 import time
-from typing import List
+from typing import List, Optional
 import httpx
-from datetime import datetime, timedelta
+import orjson
+from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 from dateutil import parser as date_parser
 
 from app.core.domain.models import Event
+from app.core.domain.categorize import categorize
 from app.core.domain.agent_models import SearchAgentResult
 from app.core.ports.agent_port import SearchAgentPort
-from app.config.settings import Settings
+from app.config.settings import Settings, get_settings
+from app.adapters.scraping.http_client import get_client
 
+_TM_DATE_FMT = "%Y-%m-%dT%H:%M:%SZ"
 
-class TicketmasterSearchAgent(SearchAgentPort):
+
+def _parse_many(date_strings: List[str]) -> List[Optional[datetime]]:
+    """
+    Fuzzy-parse a batch of SerpAPI date strings into Houston-local datetimes.
+    Runs in a worker thread so dateutil doesn't block the event loop.
+    """
+    parsed = []
+    for combined in date_strings:
+        start_time_dt = None
+        if combined:
+            try:
+                # Assume Houston timezone
+                start_time_dt = date_parser.parse(combined, fuzzy=True).replace(
+                    tzinfo=ZoneInfo("America/Chicago")
+                )
+            except Exception:
+                pass
+        parsed.append(start_time_dt)
+    return parsed
+
+
+class _BaseSearchAgent(SearchAgentPort):
+    """Shared plumbing for the HTTP-backed search agents."""
+    
+    def _fail(self, msg: str, start: float) -> SearchAgentResult:
+        """Build a failed result; ``start`` is a ``time.perf_counter()`` reading."""
+        return SearchAgentResult(
+            agent_name=self.get_agent_name(),
+            events=[],
+            success=False,
+            error_message=msg,
+            confidence=0.0,
+            execution_time_seconds=time.perf_counter() - start
+        )
+
+
+class _ETagCacheMixin:
+    """
+    Conditional GET support: remember the last ETag and the result it produced,
+    and replay that result when the API answers 304 Not Modified.
+    
+    The cache is keyed on the full request URL (query params included), so an ETag is
+    only ever revalidated against the exact request it came from. Only worth mixing into
+    agents whose request URL is stable between runs.
+    """
+    
+    _last_url: Optional[str] = None
+    _last_etag: Optional[str] = None
+    _last_result: Optional[SearchAgentResult] = None
+    
+    def _has_cached(self, request_url: httpx.URL) -> bool:
+        """True when the cached result came from exactly this request URL."""
+        return self._last_result is not None and self._last_url == str(request_url)
+    
+    def _conditional_headers(self, request_url: httpx.URL) -> dict:
+        """Send If-None-Match when we hold a cached result for this exact request."""
+        if self._last_etag and self._has_cached(request_url):
+            return {"If-None-Match": self._last_etag}
+        return {}
+    
+    def _remember(self, response: httpx.Response, result: SearchAgentResult) -> None:
+        """Cache a successful result against the request URL and ETag (if the API sent one)."""
+        etag = response.headers.get("ETag")
+        if etag:
+            self._last_url = str(response.request.url)
+            self._last_etag = etag
+            self._last_result = result
+    
+    def _cached_result(self, start_time: float) -> SearchAgentResult:
+        """Replay the cached result for a 304 Not Modified response."""
+        return self._last_result.model_copy(
+            update={"execution_time_seconds": time.perf_counter() - start_time}
+        )
+
+
+class TicketmasterSearchAgent(_BaseSearchAgent):
     """
     Search agent specialized in Ticketmaster Discovery API.
+    
+    No ETag cache: the date window is part of the query, so the URL changes every run.
     """
     
     def __init__(self, settings: Settings = None):
-        self.settings = settings or Settings()
-        self.client = httpx.AsyncClient(timeout=15)
+        self.settings = settings or get_settings()
+        self.client = get_client()
+        # Static query params; only the date window changes per call
+        self._base_params = {
+            "apikey": self.settings.ticketmaster_api_key,
+            "city": "Houston",
+            "stateCode": "TX",
+            "size": 50,
+            "sort": "date,asc"
+        }
     
     def get_agent_name(self) -> str:
         return "Ticketmaster"
     
     async def search_events(self) -> SearchAgentResult:
         """Search for events from Ticketmaster API."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         events = []
         
         try:
             if not self.settings.ticketmaster_api_key:
-                return SearchAgentResult(
-                    agent_name=self.get_agent_name(),
-                    events=[],
-                    success=False,
-                    error_message="No API key configured",
-                    confidence=0.0,
-                    execution_time_seconds=time.time() - start_time
-                )
+                return self._fail("No API key configured", start_time)
             
             url = "https://app.ticketmaster.com/discovery/v2/events.json"
             
-            start_date = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_date = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%dT%H:%M:%SZ")
-            
+            # Ticketmaster expects UTC timestamps; snapshot "now" once for both bounds
+            now = datetime.now(timezone.utc)
             params = {
-                "apikey": self.settings.ticketmaster_api_key,
-                "city": "Houston",
-                "stateCode": "TX",
-                "startDateTime": start_date,
-                "endDateTime": end_date,
-                "size": 50,
-                "sort": "date,asc"
+                **self._base_params,
+                "startDateTime": now.strftime(_TM_DATE_FMT),
+                "endDateTime": (now + timedelta(days=3)).strftime(_TM_DATE_FMT),
             }
             
             response = await self.client.get(url, params=params)
             
             if response.status_code != 200:
-                return SearchAgentResult(
-                    agent_name=self.get_agent_name(),
-                    events=[],
-                    success=False,
-                    error_message=f"API returned status {response.status_code}",
-                    confidence=0.0,
-                    execution_time_seconds=time.time() - start_time
-                )
+                return self._fail(f"API returned status {response.status_code}", start_time)
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             for item in data.get("_embedded", {}).get("events", [])[:20]:
-                categories = self._categorize_event(
+                categories = categorize(
                     item.get("name", ""),
                     item.get("info", "")
                 )
@@ -124,79 +195,36 @@ class TicketmasterSearchAgent(SearchAgentPort):
                 events=events,
                 success=True,
                 confidence=0.9,
-                execution_time_seconds=time.time() - start_time
+                execution_time_seconds=time.perf_counter() - start_time
             )
             
         except Exception as e:
-            return SearchAgentResult(
-                agent_name=self.get_agent_name(),
-                events=[],
-                success=False,
-                error_message=str(e),
-                confidence=0.0,
-                execution_time_seconds=time.time() - start_time
-            )
-    
-    def _categorize_event(self, title: str, description: str = "") -> List[str]:
-        """Intelligently categorize events."""
-        categories = []
-        text = f"{title} {description}".lower()
-        
-        if any(word in text for word in ["bike", "cycling", "cycle", "ride", "pedal", "cyclist", "bicycle"]):
-            categories.append("cycling")
-        
-        if any(word in text for word in ["hike", "trail", "park", "outdoor", "nature", "kayak", "run", "walk", "camping", "fishing"]):
-            categories.append("outdoor")
-        
-        if any(word in text for word in ["concert", "music", "band", "show", "live music", "performance", "symphony", "jazz", "rock", "hip hop", "dj", "singer", "festival"]):
-            categories.append("music")
-        
-        if any(word in text for word in ["food", "dining", "restaurant", "brunch", "dinner", "cooking", "culinary", "wine", "beer", "tasting"]):
-            categories.append("food")
-        
-        if any(word in text for word in ["art", "museum", "gallery", "exhibition", "theater", "theatre", "play", "comedy", "film", "movie"]):
-            categories.append("arts")
-        
-        if any(word in text for word in ["family", "kids", "children", "playground"]):
-            categories.append("family")
-        
-        if any(word in text for word in ["sports", "game", "match", "basketball", "football", "baseball", "soccer", "hockey"]):
-            categories.append("sports")
-        
-        return categories
+            return self._fail(str(e), start_time)
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """No-op: the shared HTTP client is closed by close_client() at shutdown."""
 
 
-class MeetupSearchAgent(SearchAgentPort):
+class MeetupSearchAgent(_BaseSearchAgent):
     """
     Search agent specialized in Meetup GraphQL API.
     """
     
     def __init__(self, settings: Settings = None):
-        self.settings = settings or Settings()
-        self.client = httpx.AsyncClient(timeout=15)
+        self.settings = settings or get_settings()
+        self.client = get_client()
     
     def get_agent_name(self) -> str:
         return "Meetup"
     
     async def search_events(self) -> SearchAgentResult:
         """Search for events from Meetup API."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         events = []
         
         try:
             if not self.settings.meetup_api_key:
-                return SearchAgentResult(
-                    agent_name=self.get_agent_name(),
-                    events=[],
-                    success=False,
-                    error_message="No API key configured",
-                    confidence=0.0,
-                    execution_time_seconds=time.time() - start_time
-                )
+                return self._fail("No API key configured", start_time)
             
             url = "https://api.meetup.com/gql"
             headers = {"Authorization": f"Bearer {self.settings.meetup_api_key}"}
@@ -220,23 +248,16 @@ class MeetupSearchAgent(SearchAgentPort):
             response = await self.client.post(url, headers=headers, json={"query": query})
             
             if response.status_code != 200:
-                return SearchAgentResult(
-                    agent_name=self.get_agent_name(),
-                    events=[],
-                    success=False,
-                    error_message=f"API returned status {response.status_code}",
-                    confidence=0.0,
-                    execution_time_seconds=time.time() - start_time
-                )
+                return self._fail(f"API returned status {response.status_code}", start_time)
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             for edge in data.get("data", {}).get("keywordSearch", {}).get("edges", []):
                 node = edge.get("node", {})
                 title = node.get("title", "")
                 desc = node.get("description", "")
                 
-                categories = self._categorize_event(title, desc)
+                categories = categorize(title, desc)
                 
                 events.append(Event(
                     title=title[:200],
@@ -251,80 +272,37 @@ class MeetupSearchAgent(SearchAgentPort):
                 events=events,
                 success=True,
                 confidence=0.8,
-                execution_time_seconds=time.time() - start_time
+                execution_time_seconds=time.perf_counter() - start_time
             )
             
         except Exception as e:
-            return SearchAgentResult(
-                agent_name=self.get_agent_name(),
-                events=[],
-                success=False,
-                error_message=str(e),
-                confidence=0.0,
-                execution_time_seconds=time.time() - start_time
-            )
-    
-    def _categorize_event(self, title: str, description: str = "") -> List[str]:
-        """Intelligently categorize events."""
-        categories = []
-        text = f"{title} {description}".lower()
-        
-        if any(word in text for word in ["bike", "cycling", "cycle", "ride", "pedal", "cyclist", "bicycle"]):
-            categories.append("cycling")
-        
-        if any(word in text for word in ["hike", "trail", "park", "outdoor", "nature", "kayak", "run", "walk", "camping", "fishing"]):
-            categories.append("outdoor")
-        
-        if any(word in text for word in ["concert", "music", "band", "show", "live music", "performance", "symphony", "jazz", "rock", "hip hop", "dj", "singer", "festival"]):
-            categories.append("music")
-        
-        if any(word in text for word in ["food", "dining", "restaurant", "brunch", "dinner", "cooking", "culinary", "wine", "beer", "tasting"]):
-            categories.append("food")
-        
-        if any(word in text for word in ["art", "museum", "gallery", "exhibition", "theater", "theatre", "play", "comedy", "film", "movie"]):
-            categories.append("arts")
-        
-        if any(word in text for word in ["family", "kids", "children", "playground"]):
-            categories.append("family")
-        
-        if any(word in text for word in ["sports", "game", "match", "basketball", "football", "baseball", "soccer", "hockey"]):
-            categories.append("sports")
-        
-        return categories
+            return self._fail(str(e), start_time)
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """No-op: the shared HTTP client is closed by close_client() at shutdown."""
 
 
-class SerpAPIEventsAgent(SearchAgentPort):
+class SerpAPIEventsAgent(_ETagCacheMixin, _BaseSearchAgent):
     """
     Search agent using SerpAPI to scrape Google Events.
     This aggregates events from ALL sources (Eventbrite, Ticketmaster, Meetup, etc.)
     """
     
     def __init__(self, settings: Settings = None):
-        self.settings = settings or Settings()
-        self.client = httpx.AsyncClient(timeout=15)
+        self.settings = settings or get_settings()
+        self.client = get_client()
     
     def get_agent_name(self) -> str:
         return "SerpAPI (Google Events)"
     
     async def search_events(self) -> SearchAgentResult:
         """Search for events using SerpAPI's Google Events engine."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         events = []
         
         try:
             if not self.settings.serpapi_key:
-                return SearchAgentResult(
-                    agent_name=self.get_agent_name(),
-                    events=[],
-                    success=False,
-                    error_message="No API key configured",
-                    confidence=0.0,
-                    execution_time_seconds=time.time() - start_time
-                )
+                return self._fail("No API key configured", start_time)
             
             url = "https://serpapi.com/search"
             
@@ -337,50 +315,43 @@ class SerpAPIEventsAgent(SearchAgentPort):
                 "api_key": self.settings.serpapi_key
             }
             
-            response = await self.client.get(url, params=params)
+            request_url = httpx.URL(url, params=params)
+            response = await self.client.get(request_url, headers=self._conditional_headers(request_url))
+            
+            if response.status_code == 304 and self._has_cached(request_url):
+                return self._cached_result(start_time)
             
             if response.status_code != 200:
                 error_msg = f"API returned status {response.status_code}"
                 try:
-                    error_data = response.json()
+                    error_data = orjson.loads(response.content)
                     if "error" in error_data:
                         error_msg += f": {error_data['error']}"
                 except Exception:
                     pass
                 
-                return SearchAgentResult(
-                    agent_name=self.get_agent_name(),
-                    events=[],
-                    success=False,
-                    error_message=error_msg,
-                    confidence=0.0,
-                    execution_time_seconds=time.time() - start_time
-                )
+                return self._fail(error_msg, start_time)
+            
+            data = orjson.loads(response.content)
+            
+            items = data.get("events_results", [])[:30]  # Limit to 30
             
-            data = response.json()
+            # Combine date and time if available; parse the whole batch off the event loop
+            date_strings = []
+            for item in items:
+                date_info = item.get("date") or {}
+                start_date_str = date_info.get("start_date", "")
+                when_str = date_info.get("when", "")
+                if start_date_str and when_str:
+                    date_strings.append(f"{start_date_str} {when_str}")
+                else:
+                    date_strings.append(start_date_str)
+            parsed_dates = await asyncio.to_thread(_parse_many, date_strings)
             
             # Parse Google Events results
-            for item in data.get("events_results", [])[:30]:  # Limit to 30
+            for item, start_time_dt in zip(items, parsed_dates):
                 title = item.get("title", "")
                 
-                # Parse date
-                start_time_dt = None
-                date_info = item.get("date", {})
-                if date_info:
-                    # Try to parse start_date and when
-                    start_date_str = date_info.get("start_date", "")
-                    when_str = date_info.get("when", "")
-                    
-                    if start_date_str:
-                        try:
-                            # Combine date and time if available
-                            combined = f"{start_date_str} {when_str}" if when_str else start_date_str
-                            parsed = date_parser.parse(combined, fuzzy=True)
-                            # Assume Houston timezone
-                            start_time_dt = parsed.replace(tzinfo=ZoneInfo("America/Chicago"))
-                        except Exception:
-                            pass
-                
                 # Get location
                 location = None
                 address = item.get("address", [])
@@ -398,7 +369,7 @@ class SerpAPIEventsAgent(SearchAgentPort):
                     description = item["description"][:500]
                 
                 # Categorize
-                categories = self._categorize_event(title, description or "")
+                categories = categorize(title, description or "")
                 
                 events.append(Event(
                     title=title[:200],
@@ -410,55 +381,21 @@ class SerpAPIEventsAgent(SearchAgentPort):
                     categories=categories
                 ))
             
-            return SearchAgentResult(
+            result = SearchAgentResult(
                 agent_name=self.get_agent_name(),
                 events=events,
                 success=True,
                 confidence=0.95,  # High confidence - Google aggregates from many sources
-                execution_time_seconds=time.time() - start_time
+                execution_time_seconds=time.perf_counter() - start_time
             )
+            self._remember(response, result)
+            return result
             
         except Exception as e:
-            return SearchAgentResult(
-                agent_name=self.get_agent_name(),
-                events=[],
-                success=False,
-                error_message=str(e),
-                confidence=0.0,
-                execution_time_seconds=time.time() - start_time
-            )
-    
-    def _categorize_event(self, title: str, description: str = "") -> List[str]:
-        """Intelligently categorize events."""
-        categories = []
-        text = f"{title} {description}".lower()
-        
-        if any(word in text for word in ["bike", "cycling", "cycle", "ride", "pedal", "cyclist", "bicycle"]):
-            categories.append("cycling")
-        
-        if any(word in text for word in ["hike", "trail", "park", "outdoor", "nature", "kayak", "run", "walk", "camping", "fishing"]):
-            categories.append("outdoor")
-        
-        if any(word in text for word in ["concert", "music", "band", "show", "live music", "performance", "symphony", "jazz", "rock", "hip hop", "dj", "singer", "festival"]):
-            categories.append("music")
-        
-        if any(word in text for word in ["food", "dining", "restaurant", "brunch", "dinner", "cooking", "culinary", "wine", "beer", "tasting"]):
-            categories.append("food")
-        
-        if any(word in text for word in ["art", "museum", "gallery", "exhibition", "theater", "theatre", "play", "comedy", "film", "movie"]):
-            categories.append("arts")
-        
-        if any(word in text for word in ["family", "kids", "children", "playground"]):
-            categories.append("family")
-        
-        if any(word in text for word in ["sports", "game", "match", "basketball", "football", "baseball", "soccer", "hockey"]):
-            categories.append("sports")
-        
-        return categories
+            return self._fail(str(e), start_time)
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """No-op: the shared HTTP client is closed by close_client() at shutdown."""
 
 
 async def run_search_agents_parallel(
@@ -467,8 +404,6 @@ async def run_search_agents_parallel(
     """
     Run multiple search agents in parallel.
     """
-    import asyncio
-    
     results = await asyncio.gather(
         *[agent.search_events() for agent in agents],
         return_exceptions=True
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy import String, DateTime, Text
+from sqlalchemy.dialects.postgresql import ARRAY
 
 class Base(DeclarativeBase): pass
 
@@ -14,6 +15,6 @@ class EventORM(Base):
     location: Mapped[Optional[str]] = mapped_column(String(300), nullable=True)
     start_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     end_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
-    categories: Mapped[Optional[str]] = mapped_column(String(300), nullable=True)
+    categories: Mapped[Optional[list[str]]] = mapped_column(ARRAY(String), nullable=True)
     source: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
@@ -1,24 +1,31 @@
-from typing import List
-from sqlalchemy import select, desc
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import select, desc, insert, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.domain.models import Event
+from app.core.domain.categorize import FILTER_TAG_KEYWORDS
 from app.core.ports.event_repository_port import EventRepositoryPort
 from .models import EventORM
 from .session import SessionLocal
 
 def _to_domain(e: EventORM) -> Event:
-    cats = (e.categories or "").split(",") if e.categories else []
-    return Event(id=e.id, title=e.title, description=e.description, url=e.url, location=e.location, start_time=e.start_time, end_time=e.end_time, categories=cats, source=e.source)
+    return Event(id=e.id, title=e.title, description=e.description, url=e.url, location=e.location, start_time=e.start_time, end_time=e.end_time, categories=e.categories or [], source=e.source)
+
+def _to_row(ev: Event, created_at: datetime) -> dict:
+    return dict(title=ev.title, description=ev.description, url=str(ev.url) if ev.url else None, location=ev.location, start_time=ev.start_time, end_time=ev.end_time, categories=list(ev.categories) if ev.categories else None, source=ev.source, created_at=created_at)
 
 class PostgresEventRepository(EventRepositoryPort):
     def __init__(self, session_factory: SessionLocal.__class__ = SessionLocal):
         self._session_factory = session_factory
 
     async def save_events(self, events: List[Event]) -> None:
+        if not events:
+            return
+        # Single multi-row INSERT from plain dicts; skips per-event ORM instance construction
+        created_at = datetime.utcnow()
+        rows = [_to_row(ev, created_at) for ev in events]
         async with self._session_factory() as session:  # type: AsyncSession
-            for ev in events:
-                orm = EventORM(title=ev.title, description=ev.description, url=str(ev.url) if ev.url else None, location=ev.location, start_time=ev.start_time, end_time=ev.end_time, categories=",".join(ev.categories) if ev.categories else None, source=ev.source)
-                session.add(orm)
+            await session.execute(insert(EventORM).values(rows))
             await session.commit()
 
     async def get_latest_events(self, limit: int = 20) -> List[Event]:
@@ -27,3 +34,18 @@ class PostgresEventRepository(EventRepositoryPort):
             res = await session.execute(stmt)
             rows = res.scalars().all()
             return [_to_domain(r) for r in rows]
+
+    async def search_events(self, q: Optional[str], tags: List[str], limit: int = 50) -> List[Event]:
+        """Latest events whose title/description contain ``q`` and match every known tag."""
+        text = func.lower(EventORM.title + " " + func.coalesce(EventORM.description, ""))
+        stmt = select(EventORM)
+        if q:
+            stmt = stmt.where(text.contains(q.lower(), autoescape=True))
+        for tag in tags:
+            keywords = FILTER_TAG_KEYWORDS.get(tag.lower())
+            if keywords:
+                stmt = stmt.where(or_(*(text.contains(k) for k in keywords)))
+        stmt = stmt.order_by(desc(EventORM.created_at)).limit(limit)
+        async with self._session_factory() as session:  # type: AsyncSession
+            res = await session.execute(stmt)
+            return [_to_domain(r) for r in res.scalars().all()]
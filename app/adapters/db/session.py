@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from app.config.settings import Settings
-_settings = Settings()
+from app.config.settings import get_settings
+_settings = get_settings()
+# One engine (and connection pool) per process; every repository shares it
 engine = create_async_engine(_settings.database_url, echo=False, pool_pre_ping=True)
 SessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(bind=engine, expire_on_commit=False)
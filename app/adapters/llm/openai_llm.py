@@ -1,40 +1,19 @@
 from typing import List, Dict
 from app.core.domain.models import Event
 from app.core.ports.llm_port import LLMPort
-from app.config.settings import Settings
+from app.config.settings import get_settings
 from jinja2 import Environment, FileSystemLoader
 from datetime import datetime
 from openai import AsyncOpenAI
 import os
 
-# Import scoring keywords from domain services
-from app.core.domain.services import CYCLING, COUPLE_ACTIVITIES, MUSIC, DOG_FRIENDLY, OUTDOOR, KID_FOCUSED
-
-
-def calculate_event_score(event: Event) -> int:
-    """Calculate the priority score for an event (matches domain logic)"""
-    txt = f"{event.title} {event.description or ''}".lower()
-    score = 0
-    
-    if any(k in txt for k in CYCLING):
-        score += 10
-    if any(k in txt for k in COUPLE_ACTIVITIES):
-        score += 9
-    if any(k in txt for k in MUSIC):
-        score += 8
-    if any(k in txt for k in DOG_FRIENDLY):
-        score += 7
-    if any(k in txt for k in OUTDOOR):
-        score += 5
-    if any(k in txt for k in KID_FOCUSED):
-        score -= 5
-    
-    return score
+# Scoring lives in the domain so the summary and the ranking never drift apart
+from app.core.domain.services import score_event
 
 
 class OpenAILLMAdapter(LLMPort):
     def __init__(self, api_key: str = None, model: str = None, temperature: float = None):
-        s = Settings()
+        s = get_settings()
         self.api_key = api_key or s.openai_api_key
         self.model = model or s.openai_model
         self.temperature = temperature if temperature is not None else s.openai_temperature
@@ -50,7 +29,7 @@ class OpenAILLMAdapter(LLMPort):
         
         # Calculate scores for each event to show intensity levels
         events_with_scores = [
-            {"event": e, "score": calculate_event_score(e)}
+            {"event": e, "score": score_event(e)}
             for e in events
         ]
         
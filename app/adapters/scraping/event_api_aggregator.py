@@ -2,12 +2,39 @@
 API-based event aggregator for Houston events.
 Pulls from multiple APIs: Eventbrite, Ticketmaster, Meetup.
 """
+import asyncio
+from itertools import islice
 from typing import List
-import httpx
+import orjson
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from app.core.domain.models import Event
-from app.config.settings import Settings
+from app.core.domain.categorize import categorize
+from app.config.settings import Settings, get_settings
+from app.adapters.scraping.http_client import get_client
+
+# Stream-decode large API payloads so we stop after the events we keep
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+_HOUSTON_TZ = ZoneInfo("America/Chicago")
+MAX_EVENTS_PER_SOURCE = 20
+
+
+def _first_items(content: bytes, path: str, limit: int = MAX_EVENTS_PER_SOURCE) -> List[dict]:
+    """
+    First ``limit`` items of the JSON array at dotted ``path`` (e.g. "_embedded.events").
+    With ijson the remaining items are never decoded; otherwise falls back to orjson.
+    """
+    if IJSON_AVAILABLE:
+        return list(islice(ijson.items(content, f"{path}.item", use_float=True), limit))
+    data = orjson.loads(content)
+    for key in path.split("."):
+        data = data.get(key, {}) if isinstance(data, dict) else {}
+    return data[:limit] if isinstance(data, list) else []
 
 
 class EventAPIAggregator:
@@ -18,35 +45,40 @@ class EventAPIAggregator:
     SEARCH_RADIUS = "50mi"  # 50 mile radius from Houston
     
     def __init__(self, settings: Settings = None):
-        self.settings = settings or Settings()
-        self.client = httpx.AsyncClient(timeout=15)
+        self.settings = settings or get_settings()
+        self.client = get_client()
     
-    async def get_all_events(self) -> List[Event]:
-        """Fetch events from all sources."""
-        all_events = []
+    async def get_all_events(self, dedupe: bool = True) -> List[Event]:
+        """Fetch events from all sources (deduplicated by title unless ``dedupe=False``)."""
+        # One "now" snapshot shared by every provider's date window
+        now = datetime.now()
         
-        # Get events from each source
+        # Fan out to every configured provider concurrently
+        tasks = []
         if self.settings.eventbrite_api_key:
-            all_events.extend(await self._get_eventbrite_events())
+            tasks.append(self._get_eventbrite_events(now))
         
         if self.settings.ticketmaster_api_key:
-            all_events.extend(await self._get_ticketmaster_events())
+            tasks.append(self._get_ticketmaster_events(now))
         
         if self.settings.meetup_api_key:
-            all_events.extend(await self._get_meetup_events())
+            tasks.append(self._get_meetup_events())
         
-        # Deduplicate by title
-        seen_titles = set()
-        unique_events = []
-        for event in all_events:
-            title_lower = event.title.lower()
-            if title_lower not in seen_titles:
-                seen_titles.add(title_lower)
-                unique_events.append(event)
+        all_events = []
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                print(f"Event API provider failed: {result}")
+                continue
+            all_events.extend(result)
+        
+        if not dedupe:
+            return all_events
         
-        return unique_events
+        # Deduplicate by title
+        seen = set()
+        return [e for e in all_events if not (e.title_key in seen or seen.add(e.title_key))]
     
-    async def _get_eventbrite_events(self) -> List[Event]:
+    async def _get_eventbrite_events(self, now: datetime) -> List[Event]:
         """Fetch events from Eventbrite API."""
         events = []
         try:
@@ -55,8 +87,8 @@ class EventAPIAggregator:
             headers = {"Authorization": f"Bearer {self.settings.eventbrite_api_key}"}
             
             # Get events for TODAY through next 3 days only
-            start_date = datetime.now().isoformat()
-            end_date = (datetime.now() + timedelta(days=3)).isoformat()
+            start_date = now.isoformat()
+            end_date = (now + timedelta(days=3)).isoformat()
             
             params = {
                 "location.latitude": self.HOUSTON_LAT,
@@ -70,12 +102,10 @@ class EventAPIAggregator:
             
             response = await self.client.get(url, headers=headers, params=params)
             if response.status_code == 200:
-                data = response.json()
-                for item in data.get("events", [])[:20]:  # Limit to 20
-                    categories = self._categorize_event(
-                        item.get("name", {}).get("text", ""),
-                        item.get("description", {}).get("text", "")
-                    )
+                for item in _first_items(response.content, "events"):  # Limit to 20
+                    name = (item.get("name") or {}).get("text", "")
+                    desc = (item.get("description") or {}).get("text", "")
+                    categories = categorize(name, desc)
                     
                     # Parse start time and convert to Houston (Central) time
                     start_time = None
@@ -83,7 +113,7 @@ class EventAPIAggregator:
                         try:
                             utc_time = datetime.fromisoformat(item["start"].get("utc", "").replace("Z", "+00:00"))
                             # Convert to Houston time (US/Central)
-                            start_time = utc_time.astimezone(ZoneInfo("America/Chicago"))
+                            start_time = utc_time.astimezone(_HOUSTON_TZ)
                         except:
                             pass
                     
@@ -96,8 +126,8 @@ class EventAPIAggregator:
                             location = f"{venue_name}, {city}" if city else venue_name
                     
                     events.append(Event(
-                        title=item.get("name", {}).get("text", "")[:200],
-                        description=item.get("description", {}).get("text", "")[:500] if item.get("description") else None,
+                        title=name[:200],
+                        description=desc[:500] if desc else None,
                         url=item.get("url"),
                         start_time=start_time,
                         location=location,
@@ -109,15 +139,15 @@ class EventAPIAggregator:
         
         return events
     
-    async def _get_ticketmaster_events(self) -> List[Event]:
+    async def _get_ticketmaster_events(self, now: datetime) -> List[Event]:
         """Fetch events from Ticketmaster Discovery API."""
         events = []
         try:
             url = "https://app.ticketmaster.com/discovery/v2/events.json"
             
             # Filter to TODAY through next 3 days only
-            start_date = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_date = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%dT%H:%M:%SZ")
+            start_date = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+            end_date = (now + timedelta(days=3)).strftime("%Y-%m-%dT%H:%M:%SZ")
             
             params = {
                 "apikey": self.settings.ticketmaster_api_key,
@@ -131,12 +161,10 @@ class EventAPIAggregator:
             
             response = await self.client.get(url, params=params)
             if response.status_code == 200:
-                data = response.json()
-                for item in data.get("_embedded", {}).get("events", [])[:20]:
-                    categories = self._categorize_event(
-                        item.get("name", ""),
-                        item.get("info", "")
-                    )
+                for item in _first_items(response.content, "_embedded.events"):
+                    name = item.get("name", "")
+                    info = item.get("info", "")
+                    categories = categorize(name, info)
                     
                     # Add specific category from Ticketmaster
                     classifications = item.get("classifications", [])
@@ -157,7 +185,7 @@ class EventAPIAggregator:
                             try:
                                 utc_time = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
                                 # Convert to Houston time (US/Central)
-                                start_time = utc_time.astimezone(ZoneInfo("America/Chicago"))
+                                start_time = utc_time.astimezone(_HOUSTON_TZ)
                             except:
                                 pass
                     
@@ -171,8 +199,8 @@ class EventAPIAggregator:
                             location = f"{venue_name}, {city}" if city else venue_name
                     
                     events.append(Event(
-                        title=item.get("name", "")[:200],
-                        description=item.get("info", "")[:500] if item.get("info") else None,
+                        title=name[:200],
+                        description=info[:500] if info else None,
                         url=item.get("url"),
                         start_time=start_time,
                         location=location,
@@ -211,13 +239,13 @@ class EventAPIAggregator:
             
             response = await self.client.post(url, headers=headers, json={"query": query})
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 for edge in data.get("data", {}).get("keywordSearch", {}).get("edges", []):
                     node = edge.get("node", {})
                     title = node.get("title", "")
                     desc = node.get("description", "")
                     
-                    categories = self._categorize_event(title, desc)
+                    categories = categorize(title, desc)
                     
                     events.append(Event(
                         title=title[:200],
@@ -231,42 +259,6 @@ class EventAPIAggregator:
         
         return events
     
-    def _categorize_event(self, title: str, description: str = "") -> List[str]:
-        """Intelligently categorize events based on title and description."""
-        categories = []
-        text = f"{title} {description}".lower()
-        
-        # Cycling
-        if any(word in text for word in ["bike", "cycling", "cycle", "ride", "pedal", "cyclist", "bicycle"]):
-            categories.append("cycling")
-        
-        # Outdoor
-        if any(word in text for word in ["hike", "trail", "park", "outdoor", "nature", "kayak", "run", "walk", "camping", "fishing"]):
-            categories.append("outdoor")
-        
-        # Music
-        if any(word in text for word in ["concert", "music", "band", "show", "live music", "performance", "symphony", "jazz", "rock", "hip hop", "dj", "singer", "festival"]):
-            categories.append("music")
-        
-        # Food & Dining
-        if any(word in text for word in ["food", "dining", "restaurant", "brunch", "dinner", "cooking", "culinary", "wine", "beer", "tasting"]):
-            categories.append("food")
-        
-        # Arts & Culture
-        if any(word in text for word in ["art", "museum", "gallery", "exhibition", "theater", "theatre", "play", "comedy", "film", "movie"]):
-            categories.append("arts")
-        
-        # Family & Kids
-        if any(word in text for word in ["family", "kids", "children", "playground"]):
-            categories.append("family")
-        
-        # Sports
-        if any(word in text for word in ["sports", "game", "match", "basketball", "football", "baseball", "soccer", "hockey"]):
-            categories.append("sports")
-        
-        return categories
-    
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """No-op: the shared client is closed by http_client.close_client() on shutdown."""
 
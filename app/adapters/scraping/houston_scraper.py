@@ -1,9 +1,15 @@
-from typing import List
+import asyncio
+from itertools import chain
+from typing import List, Optional, Tuple
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from app.core.domain.models import Event
+from app.core.domain.categorize import KeywordTagger
 from app.core.ports.scraper_port import ScraperPort
 from app.adapters.scraping.event_api_aggregator import EventAPIAggregator
+from app.adapters.scraping.http_client import get_client
+from app.adapters.scraping.scrape_cache import ScrapeCache
+from app.config.settings import get_settings
 
 HINT_SITES = [
     # Outdoor & Parks
@@ -29,36 +35,35 @@ HINT_SITES = [
     ("https://www.bringfido.com/attraction/city/houston_tx_us/", "BringFido Houston"),
 ]
 
+# Title keywords per category (immutable; the tagger below is built from it once at import)
+_KEYWORDS_BY_CAT = (
+    # Cycling (HIGHEST priority!)
+    ("cycling", ("bike", "cycling", "cycle", "ride", "pedal", "cyclist")),
+    # Music
+    ("music", ("concert", "music", "band", "show", "live music", "performance", "symphony", "jazz", "rock", "hip hop", "dj")),
+    # Dog-friendly
+    ("dog-friendly", ("dog", "dog-friendly", "pet", "pet-friendly", "pup", "canine", "bark", "dogs welcome")),
+    # Couple activities
+    ("couple-friendly", ("wine", "brewery", "beer", "cocktail", "tasting", "comedy", "trivia", "art walk", "gallery", "date night")),
+    # Outdoor
+    ("outdoor", ("hike", "trail", "park", "outdoor", "nature", "kayak", "run", "walk", "paddle")),
+)
+
+_TITLE_TAGGER = KeywordTagger(_KEYWORDS_BY_CAT)
+
+_LINKS_ONLY = SoupStrainer("a")
+
 def _parse_events_from_html(html: str, source_name: str) -> List[Event]:
-    soup = BeautifulSoup(html, "html.parser")
+    # lxml is a C parser; the strainer skips building tree nodes for everything but links
+    soup = BeautifulSoup(html, "lxml", parse_only=_LINKS_ONLY)
     events: List[Event] = []
-    for a in soup.select("a"):
+    for a in soup.find_all("a"):
         title = (a.get_text() or "").strip()
         href = a.get("href")
         if title and href and len(title) > 6:
             # Auto-categorize based on keywords
-            categories = []
             title_lower = title.lower()
-            
-            # Cycling (HIGHEST priority!)
-            if any(word in title_lower for word in ["bike", "cycling", "cycle", "ride", "pedal", "cyclist"]):
-                categories.append("cycling")
-            
-            # Music
-            if any(word in title_lower for word in ["concert", "music", "band", "show", "live music", "performance", "symphony", "jazz", "rock", "hip hop", "dj"]):
-                categories.append("music")
-            
-            # Dog-friendly
-            if any(word in title_lower for word in ["dog", "dog-friendly", "pet", "pet-friendly", "pup", "canine", "bark", "dogs welcome"]):
-                categories.append("dog-friendly")
-            
-            # Couple activities
-            if any(word in title_lower for word in ["wine", "brewery", "beer", "cocktail", "tasting", "comedy", "trivia", "art walk", "gallery", "date night"]):
-                categories.append("couple-friendly")
-            
-            # Outdoor
-            if any(word in title_lower for word in ["hike", "trail", "park", "outdoor", "nature", "kayak", "run", "walk", "paddle"]):
-                categories.append("outdoor")
+            categories = _TITLE_TAGGER.tag(title_lower)
             
             events.append(Event(
                 title=title[:200], 
@@ -68,42 +73,86 @@ def _parse_events_from_html(html: str, source_name: str) -> List[Event]:
             ))
     return events[:20]
 
+# Cap concurrent site fetches so no single host gets hammered
+MAX_CONCURRENT_FETCHES = 6
+
+_cache: Optional[ScrapeCache] = None
+
+def _get_cache() -> ScrapeCache:
+    global _cache
+    if _cache is None:
+        _cache = ScrapeCache(get_settings().scrape_cache_path)
+    return _cache
+
+async def _fetch_one(
+    client: httpx.AsyncClient, url: str, name: str, sem: asyncio.Semaphore
+) -> Tuple[str, List[Event]]:
+    async with sem:
+        try:
+            cache = _get_cache()
+            cached = await cache.get(url)
+            r = await client.get(url, follow_redirects=True, headers=ScrapeCache.conditional_headers(cached))
+            if r.status_code == 304 and cached:
+                print(f"♻️ {name} unchanged, reusing {len(cached[2])} cached events")
+                return name, cached[2]
+            if r.status_code == 200 and r.text:
+                scraped = _parse_events_from_html(r.text, name)
+                await cache.set(url, r.headers.get("etag"), r.headers.get("last-modified"), scraped)
+                print(f"✅ Scraped {len(scraped)} events from {name}")
+                return name, scraped
+        except Exception as e:
+            print(f"⚠️ Scraping error for {name}: {e}")
+    return name, []
+
+async def _scrape_sites() -> List[Event]:
+    sem = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    client = get_client()
+    results = await asyncio.gather(
+        *[_fetch_one(client, url, name, sem) for url, name in HINT_SITES],
+        return_exceptions=True
+    )
+    scraped_events: List[Event] = []
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"⚠️ Scraping error: {result}")
+            continue
+        _, scraped = result
+        scraped_events.extend(scraped)
+    return scraped_events
+
 class HoustonEventsScraper(ScraperPort):
     async def scrape_events(self) -> List[Event]:
-        out: List[Event] = []
-        
-        # First, try to get events from APIs (Eventbrite, Ticketmaster, Meetup)
+        # APIs (Eventbrite, Ticketmaster, Meetup) and site scraping are independent,
+        # so run them concurrently; dedup happens once below across both
         api_aggregator = EventAPIAggregator()
         try:
-            api_events = await api_aggregator.get_all_events()
-            out.extend(api_events)
-            print(f"✅ Fetched {len(api_events)} events from APIs")
-        except Exception as e:
-            print(f"⚠️ API aggregation error: {e}")
+            api_result, scrape_result = await asyncio.gather(
+                api_aggregator.get_all_events(dedupe=False),
+                _scrape_sites(),
+                return_exceptions=True
+            )
         finally:
             await api_aggregator.close()
         
-        # Then, supplement with web scraping as fallback/additional source
-        async with httpx.AsyncClient(timeout=15) as client:
-            for url, name in HINT_SITES:
-                try:
-                    r = await client.get(url, follow_redirects=True)
-                    if r.status_code == 200 and r.text:
-                        scraped = _parse_events_from_html(r.text, name)
-                        out.extend(scraped)
-                        print(f"✅ Scraped {len(scraped)} events from {name}")
-                except Exception as e:
-                    print(f"⚠️ Scraping error for {name}: {e}")
-                    continue
+        api_events: List[Event] = []
+        if isinstance(api_result, Exception):
+            print(f"⚠️ API aggregation error: {api_result}")
+        else:
+            api_events = api_result
+            print(f"✅ Fetched {len(api_events)} events from APIs")
+        
+        scraped_events: List[Event] = []
+        if isinstance(scrape_result, Exception):
+            print(f"⚠️ Scraping error: {scrape_result}")
+        else:
+            scraped_events = scrape_result
         
-        # Deduplicate by title (case insensitive)
-        seen_titles = set()
-        unique_events = []
-        for event in out:
-            title_lower = event.title.lower()
-            if title_lower not in seen_titles and len(title_lower) > 5:
-                seen_titles.add(title_lower)
-                unique_events.append(event)
+        # Deduplicate by title (case insensitive) in a single pass
+        seen = set()
+        unique_events = [
+            e for e in chain(api_events, scraped_events)
+            if len(e.title_key) > 5 and not (e.title_key in seen or seen.add(e.title_key))
+        ]
         
         print(f"🎉 Total unique events: {len(unique_events)}")
         return unique_events
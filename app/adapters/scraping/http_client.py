@@ -0,0 +1,28 @@
+"""
+Shared HTTP client for scraping, API aggregation and the OAuth callback.
+One pooled HTTP/2 client per process, so repeat requests reuse warm TLS connections.
+"""
+from typing import Optional
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=15,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client (call on app/worker shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
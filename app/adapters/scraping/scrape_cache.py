@@ -0,0 +1,86 @@
+"""
+On-disk cache of scraped pages, keyed by URL.
+Stores the page's ETag / Last-Modified validators plus the events parsed from it,
+so a 304 Not Modified reply can skip both the body transfer and the HTML parse.
+
+sqlite calls run in a worker thread so they never block the event loop. The cache is
+best-effort: any failure reads as a miss (or a skipped write), never as "no events".
+"""
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+import orjson
+from app.core.domain.models import Event
+
+# Entries older than this are dropped instead of revalidated
+MAX_AGE_SECONDS = 7 * 24 * 3600
+
+
+class ScrapeCache:
+    """Tiny sqlite-backed URL -> (etag, last_modified, events) store."""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        # One connection shared by worker threads; sqlite3 leaves serializing access to us
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, events BLOB, stored_at REAL)"
+            )
+        return self._conn
+
+    def _get_blocking(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], List[Event]]]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT etag, last_modified, events, stored_at FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None or time.time() - row[3] > MAX_AGE_SECONDS:
+            return None
+        etag, last_modified, blob, _ = row
+        return etag, last_modified, [Event.model_validate(e) for e in orjson.loads(blob)]
+
+    def _set_blocking(self, url: str, etag: Optional[str], last_modified: Optional[str], blob: bytes) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                    (url, etag, last_modified, blob, time.time()),
+                )
+
+    async def get(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], List[Event]]]:
+        """Cached (etag, last_modified, events) for ``url``; None on a miss or any cache fault."""
+        try:
+            return await asyncio.to_thread(self._get_blocking, url)
+        except Exception as e:  # sqlite errors, a corrupt blob, events from an older schema
+            print(f"⚠️ Scrape cache read failed for {url}, treating as a miss: {e}")
+            return None
+
+    async def set(self, url: str, etag: Optional[str], last_modified: Optional[str], events: List[Event]) -> None:
+        """Store the validators and parsed events; a failed write only costs the next run a full fetch."""
+        if not etag and not last_modified:
+            return  # Nothing to revalidate with next time
+        blob = orjson.dumps([e.model_dump(mode="json") for e in events])
+        try:
+            await asyncio.to_thread(self._set_blocking, url, etag, last_modified, blob)
+        except Exception as e:
+            print(f"⚠️ Scrape cache write failed for {url}: {e}")
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Tuple[Optional[str], Optional[str], List[Event]]]) -> dict:
+        """If-None-Match / If-Modified-Since headers for a cached entry."""
+        headers = {}
+        if entry:
+            etag, last_modified, _ = entry
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        return headers
@@ -1,4 +1,5 @@
 from app.core.ports.sms_port import SMSPort
+import asyncio
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -9,9 +10,10 @@ from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
-# Import premailer for inlining CSS styles for Gmail compatibility
+# CSS is normally pre-inlined at build time (python -m app.adapters.sms.inline_email_template);
+# premailer is only needed as a runtime fallback when that file is missing or stale
 try:
-    from premailer import transform
+    from premailer import Premailer
     PREMAILER_AVAILABLE = True
 except ImportError:
     PREMAILER_AVAILABLE = False
@@ -27,7 +29,83 @@ class EmailSMSAdapter(SMSPort):
         
         # Set up Jinja2 for HTML email templates
         template_dir = Path(__file__).parent.parent / "llm" / "templates"
-        self.jinja_env = Environment(loader=FileSystemLoader(str(template_dir)))
+        # Templates ship with the code, so skip per-render mtime checks and compile once
+        self.jinja_env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            auto_reload=False,
+            cache_size=400
+        )
+        source = template_dir / 'email_wrestlemania.html'
+        inlined = template_dir / 'email_wrestlemania.inlined.html'
+        self._inline_at_runtime = not (
+            inlined.exists() and inlined.stat().st_mtime >= source.stat().st_mtime
+        )
+        self._template = self.jinja_env.get_template(
+            source.name if self._inline_at_runtime else inlined.name
+        )
+        if self._inline_at_runtime:
+            logger.warning("⚠️ Pre-inlined email template missing or stale, inlining CSS per send")
+        # One configured inliner reused for every send (premailer caches parsed CSS rules)
+        self._premailer = (
+            Premailer(cache_css_parsing=True, cssutils_logging_level=logging.CRITICAL)
+            if self._inline_at_runtime and PREMAILER_AVAILABLE else None
+        )
+        
+        # One authenticated SMTP session reused across sends (guarded by a lock)
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._lock = asyncio.Lock()
+
+    def _render_html(self, promo_text: str, events: List, scratchpad_text: str) -> str:
+        html_content = self._template.render(
+            promo_text=promo_text,
+            events=events,
+            scratchpad_text=scratchpad_text
+        )
+        
+        # Inline CSS styles for Gmail compatibility (fallback path only)
+        if self._premailer is not None:
+            try:
+                html_content = self._premailer.transform(html_content, pretty_print=False)
+                logger.info("✅ CSS styles inlined for Gmail compatibility")
+            except Exception as inline_error:
+                logger.warning("⚠️ CSS inlining failed: %s", inline_error)
+        return html_content
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP('smtp.gmail.com', 587)
+        server.starttls()
+        server.login(self.gmail_address, self.gmail_app_password)
+        return server
+
+    def _get_server(self) -> smtplib.SMTP:
+        """Return the cached session if a NOOP says it's still alive, else log in again."""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPServerDisconnected, OSError):
+                pass
+            self._smtp = None
+        self._smtp = self._connect()
+        return self._smtp
+
+    def _send_blocking(self, msg: MIMEMultipart) -> None:
+        """Send over the cached session, reconnecting once if Gmail dropped it mid-send."""
+        try:
+            self._get_server().send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            self._smtp = self._connect()
+            self._smtp.send_message(msg)
+
+    async def close(self) -> None:
+        """QUIT the cached SMTP session, if any."""
+        async with self._lock:
+            if self._smtp is not None:
+                try:
+                    await asyncio.to_thread(self._smtp.quit)
+                except smtplib.SMTPException:
+                    pass
+                self._smtp = None
 
     async def send_sms(
         self, 
@@ -61,36 +139,25 @@ class EmailSMSAdapter(SMSPort):
             # Render HTML version if we have the data
             if events is not None or promo_text is not None:
                 try:
-                    template = self.jinja_env.get_template('email_wrestlemania.html')
-                    html_content = template.render(
-                        promo_text=promo_text or message,
-                        events=events or [],
-                        scratchpad_text=scratchpad_text or ""
+                    # Rendering (and any premailer fallback) is CPU-heavy; keep them off the event loop
+                    html_content = await asyncio.to_thread(
+                        self._render_html,
+                        promo_text or message,
+                        events or [],
+                        scratchpad_text or ""
                     )
                     
-                    # Inline CSS styles for Gmail compatibility
-                    if PREMAILER_AVAILABLE:
-                        try:
-                            html_content = transform(html_content)
-                            logger.info("✅ CSS styles inlined for Gmail compatibility")
-                        except Exception as inline_error:
-                            logger.warning(f"⚠️ CSS inlining failed: {inline_error}")
-                    
                     html_part = MIMEText(html_content, 'html', 'utf-8')
                     msg.attach(html_part)
                     logger.info("✅ HTML email rendered with WrestleMania template")
                 except Exception as template_error:
-                    logger.warning(f"⚠️ HTML template failed, using plain text: {template_error}")
+                    logger.warning("⚠️ HTML template failed, using plain text: %s", template_error)
             
-            # Send via Gmail SMTP
-            with smtplib.SMTP('smtp.gmail.com', 587) as server:
-                server.starttls()
-                server.login(self.gmail_address, self.gmail_app_password)
-                server.send_message(msg)
+            # Send via Gmail SMTP (blocking I/O runs in a worker thread)
+            async with self._lock:
+                await asyncio.to_thread(self._send_blocking, msg)
             
-            logger.info(f"✅ Email sent to {self.gmail_address}")
-            print(f"✅ 🏆 WRESTLEMANIA EMAIL sent to {self.gmail_address}")
+            logger.info("✅ 🏆 WRESTLEMANIA EMAIL sent to %s", self.gmail_address)
         except Exception as e:
-            logger.error(f"❌ Email failed: {e}")
-            print(f"❌ Email failed: {e}")
+            logger.error("❌ Email failed: %s", e)
             raise
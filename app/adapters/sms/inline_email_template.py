@@ -0,0 +1,60 @@
+"""
+Build step: pre-inline the WrestleMania email CSS once instead of running premailer per send.
+
+    python -m app.adapters.sms.inline_email_template
+
+Premailer parses HTML with lxml, which would mangle Jinja syntax (`>` inside `{% if %}`,
+`{{ }}` inside href). Jinja tags are swapped for inert placeholders before inlining and
+restored afterwards. `{% set x = [...] %}` literals holding HTML fragments stay visible to
+premailer so those fragments get their inline styles too.
+"""
+import logging
+import re
+from pathlib import Path
+from premailer import transform
+
+TEMPLATE_DIR = Path(__file__).parent.parent / "llm" / "templates"
+SOURCE_NAME = "email_wrestlemania.html"
+INLINED_NAME = "email_wrestlemania.inlined.html"
+
+_JINJA = re.compile(r"{{.*?}}|{%.*?%}|{#.*?#}", re.S)
+_SET_HTML = re.compile(r"({%-?\s*set\s+\w+\s*=\s*\[)(.*?)(\]\s*-?%})", re.S)
+_SET_BODY = re.compile(r"(JINJASETOPEN\d+X)(.*?)(JINJASETCLOSE\d+X)", re.S)
+_PLACEHOLDER = re.compile(r"JINJA(?:TAG|SETOPEN|SETCLOSE)(\d+)X")
+
+
+def inline_template(source: str) -> str:
+    """Return ``source`` with its <style> rules inlined, Jinja syntax left intact."""
+    blocks = []
+
+    def protect(text: str, kind: str = "TAG") -> str:
+        blocks.append(text)
+        return f"JINJA{kind}{len(blocks) - 1}X"
+
+    def hide(match: re.Match) -> str:
+        set_html = _SET_HTML.fullmatch(match.group(0))
+        if set_html and "<" in set_html.group(2):
+            return (
+                protect(set_html.group(1), "SETOPEN")
+                + set_html.group(2)
+                + protect(set_html.group(3), "SETCLOSE")
+            )
+        return protect(match.group(0))
+
+    inlined = transform(_JINJA.sub(hide, source), cssutils_logging_level=logging.CRITICAL)
+    # Inlined style="..." inside a set literal would close the Jinja string; escape the quotes
+    inlined = _SET_BODY.sub(
+        lambda m: m.group(1) + re.sub(r'style="([^"]*)"', r'style=\\"\1\\"', m.group(2)) + m.group(3),
+        inlined,
+    )
+    return _PLACEHOLDER.sub(lambda m: blocks[int(m.group(1))], inlined)
+
+
+def main() -> None:
+    source = (TEMPLATE_DIR / SOURCE_NAME).read_text(encoding="utf-8")
+    (TEMPLATE_DIR / INLINED_NAME).write_text(inline_template(source), encoding="utf-8")
+    print(f"✅ Wrote {TEMPLATE_DIR / INLINED_NAME}")
+
+
+if __name__ == "__main__":
+    main()
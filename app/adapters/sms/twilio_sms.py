@@ -1,14 +1,33 @@
 from app.core.ports.sms_port import SMSPort
-from twilio.rest import Client
+from app.adapters.scraping.http_client import get_client
 from typing import List, Optional
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
+TWILIO_API_BASE = "https://api.twilio.com/2010-04-01"
+
+
+def _error_detail(response) -> str:
+    """Twilio's JSON error message, or the raw body (e.g. a proxy's HTML 502 page, or nothing)."""
+    try:
+        return orjson.loads(response.content).get("message")
+    except (orjson.JSONDecodeError, AttributeError):
+        return response.text[:200] or "<empty body>"
+
 
 class TwilioSMSAdapter(SMSPort):
+    """
+    Send SMS through Twilio's REST API.
+
+    Posts straight to the Messages endpoint over the shared async HTTP client instead of
+    the synchronous twilio SDK, so sends never block the event loop.
+    """
+
     def __init__(self, account_sid: str, auth_token: str, from_number: str):
-        self.client = Client(account_sid, auth_token)
+        self._auth = (account_sid, auth_token)
+        self._messages_url = f"{TWILIO_API_BASE}/Accounts/{account_sid}/Messages.json"
         self.from_number = from_number
 
     async def send_sms(
@@ -30,10 +49,15 @@ class TwilioSMSAdapter(SMSPort):
             scratchpad_text: Ignored for SMS (HTML only)
         """
         try:
-            msg = self.client.messages.create(body=message, from_=self.from_number, to=to_number)
-            logger.info(f"✅ SMS sent! SID: {msg.sid}, Status: {msg.status}, To: {to_number}")
-            print(f"✅ SMS sent! SID: {msg.sid}, Status: {msg.status}, To: {to_number}")
+            response = await get_client().post(
+                self._messages_url,
+                auth=self._auth,
+                data={"Body": message, "From": self.from_number, "To": to_number},
+            )
+            if response.is_error:
+                raise RuntimeError(f"Twilio API {response.status_code}: {_error_detail(response)}")
+            msg = orjson.loads(response.content)
+            logger.info("✅ SMS sent! SID: %s, Status: %s, To: %s", msg.get("sid"), msg.get("status"), to_number)
         except Exception as e:
-            logger.error(f"❌ SMS failed: {e}")
-            print(f"❌ SMS failed: {e}")
+            logger.error("❌ SMS failed: %s", e)
             raise
@@ -1,14 +1,30 @@
-from fastapi import APIRouter, Request, HTTPException
+from fastapi import APIRouter, Depends, Request, HTTPException
 from starlette.responses import RedirectResponse
-import httpx, base64, json
-from app.config.settings import Settings
+import asyncio
+import httpx, jwt, orjson
+from app.config.settings import Settings, get_settings
 from app.utils.security import create_session_payload
+from app.adapters.scraping.http_client import get_client
 
 router = APIRouter()
-settings = Settings()
+
+GOOGLE_ISSUERS = ("https://accounts.google.com", "accounts.google.com")
+# Google's signing keys are fetched once and kept in memory across logins
+_jwks = jwt.PyJWKClient("https://www.googleapis.com/oauth2/v3/certs", cache_keys=True)
+
+def _verify_id_token(id_token: str, client_id: str) -> dict:
+    """Verify signature, aud, iss and exp of a Google id_token (blocking on first JWKS fetch)."""
+    signing_key = _jwks.get_signing_key_from_jwt(id_token).key
+    return jwt.decode(
+        id_token,
+        signing_key,
+        algorithms=["RS256"],
+        audience=client_id,
+        issuer=GOOGLE_ISSUERS,
+    )
 
 @router.get('/auth/login')
-async def login(request: Request):
+async def login(request: Request, settings: Settings = Depends(get_settings)):
     redirect_uri = f"{settings.app_base_url}/auth/callback"
     params = {
         'client_id': settings.google_client_id,
@@ -24,7 +40,12 @@ async def login(request: Request):
     return RedirectResponse(str(url))
 
 @router.get('/auth/callback')
-async def callback(request: Request, code: str | None = None, state: str | None = None):
+async def callback(
+    request: Request,
+    code: str | None = None,
+    state: str | None = None,
+    settings: Settings = Depends(get_settings),
+):
     if not code:
         raise HTTPException(status_code=400, detail='Missing code')
     token_url = 'https://oauth2.googleapis.com/token'
@@ -33,19 +54,19 @@ async def callback(request: Request, code: str | None = None, state: str | None
         'code': code, 'client_id': settings.google_client_id, 'client_secret': settings.google_client_secret,
         'redirect_uri': redirect_uri, 'grant_type': 'authorization_code'
     }
-    async with httpx.AsyncClient() as client:
-        tr = await client.post(token_url, data=data)
-        tr.raise_for_status()
-        id_token = tr.json().get('id_token')
-        if not id_token: raise HTTPException(status_code=400, detail='No id_token')
-        parts = id_token.split('.')
-        if len(parts) < 2: raise HTTPException(status_code=400, detail='Invalid id_token')
-        payload = parts[1] + '=='
-        decoded = json.loads(base64.urlsafe_b64decode(payload).decode('utf-8'))
-        email = decoded.get('email')
-        if email not in settings.allowed_emails_list:
-            raise HTTPException(status_code=403, detail='Email not authorized')
-        token = create_session_payload(email)
-        resp = RedirectResponse(url='/')
-        resp.set_cookie(settings.session_cookie_name, token, httponly=True, samesite='lax')
-        return resp
+    # Pooled client: repeat logins reuse the warm TLS connection to Google
+    tr = await get_client().post(token_url, data=data)
+    tr.raise_for_status()
+    id_token = orjson.loads(tr.content).get('id_token')
+    if not id_token: raise HTTPException(status_code=400, detail='No id_token')
+    try:
+        decoded = await asyncio.to_thread(_verify_id_token, id_token, settings.google_client_id)
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=400, detail='Invalid id_token')
+    email = decoded.get('email')
+    if (email or '').lower() not in settings.allowed_emails_set:
+        raise HTTPException(status_code=403, detail='Email not authorized')
+    token = create_session_payload(email)
+    resp = RedirectResponse(url='/')
+    resp.set_cookie(settings.session_cookie_name, token, httponly=True, samesite='lax')
+    return resp
@@ -1,20 +1,65 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from app.core.di import build_event_service
+from fastapi.responses import ORJSONResponse
+from app.api.static_files import CachedStaticFiles
+from app.core.di import build_event_service, build_agentic_event_service, build_sms_adapter
+from app.config.settings import configure_logging, get_settings
 from app.api.routers import events as events_router
 from app.api import auth as auth_router
 from app.api.routers import web as web_router
 from app.middleware.session import SessionMiddleware
+from app.adapters.scraping.http_client import close_client
+from app.adapters.db.repository import PostgresEventRepository
+from app.adapters.db.session import engine
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release pooled connections held by the shared HTTP client
+    await close_client()
+    # QUIT the email adapter's cached SMTP session (Twilio has nothing to close)
+    sms_close = getattr(app.state.sms, "close", None)
+    if sms_close is not None:
+        await sms_close()
+    # Close the pooled Postgres connections
+    await engine.dispose()
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="Houston Event Mania", version="1.0.0")
-    app.state.event_service = build_event_service()
+    configure_logging()
+    # orjson encodes the datetime-heavy /events/latest payloads in C
+    app = FastAPI(
+        title="Houston Event Mania",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
+    # Settings and the SMS adapter are built once here and shared by every service
+    app.state.settings = get_settings()
+    app.state.sms = build_sms_adapter(app.state.settings)
+    # One repository over the process-wide engine pool, shared by both services
+    app.state.repository = PostgresEventRepository()
+    app.state.event_service = build_event_service(app.state.settings, app.state.sms, app.state.repository)
+    # Built once: every trigger reuses the same agents and their HTTP/OpenAI clients
+    app.state.agentic_service = build_agentic_event_service(
+        app.state.settings, app.state.sms, app.state.repository
+    )
+    app.state.templates = web_router.build_templates()
 
     app.add_middleware(SessionMiddleware)
-    app.mount("/static", StaticFiles(directory="app/api/static"), name="static")
+    # Static assets aren't content-hashed, so cache for a day and revalidate via ETag after
+    app.mount(
+        "/static",
+        CachedStaticFiles(directory="app/api/static", cache_control="public, max-age=86400"),
+        name="static",
+    )
 
     # React Neon (stub) served at /neon (no build needed yet)
-    app.mount("/neon", StaticFiles(directory="frontend/neon", html=True), name="neon")
+    # The SPA shell must pick up new deploys, so always revalidate (cheap 304 via ETag)
+    app.mount(
+        "/neon",
+        CachedStaticFiles(directory="frontend/neon", html=True, cache_control="no-cache"),
+        name="neon",
+    )
 
     app.include_router(auth_router.router, tags=["Auth"])
     app.include_router(events_router.router, prefix="/events", tags=["Events"])
@@ -1,9 +1,20 @@
+import asyncio
 from fastapi import APIRouter, Request, BackgroundTasks
 from app.core.domain.models import Event
-from app.core.di import build_agentic_event_service
+from app.workers.celery_app import run_agentic_flow
 
 router = APIRouter()
 
+# Static description of the workflow, returned with every trigger
+AGENTIC_FLOW_DETAILS = {
+    "phases": ["searching", "reviewing", "synthesizing"],
+    "agents": {
+        "search": ["Eventbrite", "Ticketmaster", "Meetup"],
+        "review": ["URLValidator", "ContentEnricher", "RelevanceScorer", "DateVerifier"],
+        "orchestrator": "PlanningAgent (REACT pattern)"
+    }
+}
+
 
 @router.get('/latest', response_model=list[Event])
 async def latest(request: Request, limit: int = 20):
@@ -12,8 +23,8 @@ async def latest(request: Request, limit: int = 20):
     return await svc.repository.get_latest_events(limit=limit)
 
 
-@router.post('/trigger-agentic-flow')
-async def trigger_agentic_flow(background_tasks: BackgroundTasks):
+@router.post('/trigger-agentic-flow', status_code=202)
+async def trigger_agentic_flow(request: Request, background_tasks: BackgroundTasks):
     """
     Trigger the agentic workflow in the background.
     
@@ -23,23 +34,20 @@ async def trigger_agentic_flow(background_tasks: BackgroundTasks):
     3. Generate a wrestling promo
     4. Send via SMS
     
-    Returns immediately with a 202 Accepted status.
+    Returns immediately with a 202 Accepted status. The flow runs on a Celery worker
+    when one is configured (EVENTS_REDIS_URL), otherwise in this process.
     """
-    async def run_workflow():
-        service = build_agentic_event_service()
-        await service.run_daily_event_flow()
-    
-    background_tasks.add_task(run_workflow)
+    if run_agentic_flow is not None:
+        # Publishing to the broker is a blocking socket write
+        await asyncio.to_thread(run_agentic_flow.delay)
+        queued_on = "celery"
+    else:
+        background_tasks.add_task(request.app.state.agentic_service.run_daily_event_flow)
+        queued_on = "background_tasks"
     
     return {
         "status": "accepted",
         "message": "Agentic workflow triggered in background",
-        "details": {
-            "phases": ["searching", "reviewing", "synthesizing"],
-            "agents": {
-                "search": ["Eventbrite", "Ticketmaster", "Meetup"],
-                "review": ["URLValidator", "ContentEnricher", "RelevanceScorer", "DateVerifier"],
-                "orchestrator": "PlanningAgent (REACT pattern)"
-            }
-        }
+        "queued_on": queued_on,
+        "details": AGENTIC_FLOW_DETAILS,
     }
@@ -1,32 +1,39 @@
 from fastapi import APIRouter, Request, Depends, Query
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from app.core.domain.categorize import FILTER_TAG_KEYWORDS
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/api/templates")
+
+# Jinja output pieces per streamed chunk (a few event rows each)
+STREAM_BUFFER_ITEMS = 64
+
+def build_templates(directory: str = "app/api/templates") -> Jinja2Templates:
+    """
+    Templates ship with the code: no per-render mtime checks, compiled bytecode cached on
+    disk for cold starts, and every template compiled once up front.
+    """
+    env = Environment(
+        loader=FileSystemLoader(directory),
+        autoescape=select_autoescape(),
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+    for name in env.list_templates():
+        env.get_template(name)
+    return Jinja2Templates(env=env)
 
 def _svc(request: Request):
     return request.app.state.event_service
 
-def _matches(e, q: str, tags: list[str]) -> bool:
-    t = f"{e.title} {(e.description or '')}".lower()
-    ok = True
-    if q:
-        ok = q.lower() in t
-    if ok and tags:
-        txt = t
-        for tag in tags:
-            tag = tag.lower()
-            if tag == "cycling":
-                ok = ok and any(k in txt for k in ["cycling","bike","biking","bicycle","mtb","ride","critical mass"])
-            if tag == "outdoor":
-                ok = ok and any(k in txt for k in ["outdoor","park","hike","trail","run","nature","bayou","memorial park"])
-    return ok
+def _templates(request: Request) -> Jinja2Templates:
+    return request.app.state.templates
 
 @router.get("/", response_class=HTMLResponse)
-async def home(request: Request, service = Depends(_svc)):
+async def home(request: Request, service = Depends(_svc), templates = Depends(_templates)):
     events = await service.repository.get_latest_events(limit=30)
-    return templates.TemplateResponse("index.html", {"request": request, "events": events})
+    return templates.TemplateResponse(request, "index.html", {"events": events})
 
 @router.get("/events/partial", response_class=HTMLResponse)
 async def events_partial(
@@ -35,9 +42,15 @@ async def events_partial(
     q: str | None = Query(None),
     tags: list[str] = Query(default=[]),
     service = Depends(_svc),
+    templates = Depends(_templates),
 ):
-    all_events = await service.repository.get_latest_events(limit=200)
-    filtered = [e for e in all_events if _matches(e, q or "", tags)]
-    return templates.TemplateResponse("_events_list.html", {
-        "request": request, "events": filtered[:limit], "q": q or "", "tags": tags
-    })
\ No newline at end of file
+    # Filtering and LIMIT happen in SQL; the unfiltered view is just the latest rows
+    filter_tags = [tag.lower() for tag in tags if tag.lower() in FILTER_TAG_KEYWORDS]
+    if q or filter_tags:
+        events = await service.repository.search_events(q, filter_tags, limit=limit)
+    else:
+        events = await service.repository.get_latest_events(limit=limit)
+    # Stream the partial so HTMX can start swapping rows before the whole list renders
+    stream = templates.get_template("_events_list.html").stream(events=events, q=q or "", tags=tags)
+    stream.enable_buffering(STREAM_BUFFER_ITEMS)
+    return StreamingResponse(stream, media_type="text/html")
\ No newline at end of file
@@ -1,4 +1,8 @@
-from typing import List
+import logging
+import tempfile
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import FrozenSet, List
 from pydantic import AnyHttpUrl, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -44,7 +48,14 @@ class Settings(BaseSettings):
     session_cookie_name: str = "event_mania_session"
     session_lifetime_days: int = 7
 
+    # Celery broker/backend (optional - API falls back to in-process BackgroundTasks)
+    redis_url: str = ""
+
+    # sqlite file for scraped-page ETags/events (absolute, so it doesn't depend on the CWD)
+    scrape_cache_path: str = str(Path(tempfile.gettempdir()) / "htown_scrape_cache.sqlite")
+
     dev_sms_mute: int = 0
+    log_level: str = "INFO"
     frontend_mode: str = "html"
 
     @property
@@ -53,3 +64,29 @@ class Settings(BaseSettings):
         if not self.allowed_emails:
             return []
         return [e.strip() for e in self.allowed_emails.split(",") if e.strip()]
+
+    @cached_property
+    def allowed_emails_set(self) -> FrozenSet[str]:
+        """Lower-cased allowed emails, parsed once for O(1) login checks."""
+        return frozenset(e.lower() for e in self.allowed_emails_list)
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Process-wide Settings, so the environment and .env file are parsed once.
+
+    Tests that change EVENTS_* variables call ``get_settings.cache_clear()`` afterwards.
+    """
+    return Settings()
+
+
+def configure_logging() -> None:
+    """Route adapter loggers to stderr once per process (API and worker entry points)."""
+    logging.basicConfig(
+        level=get_settings().log_level.upper(),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        force=True,
+    )
+    # httpx logs every request at INFO; the scrapers make dozens per run
+    logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -5,7 +5,10 @@ from app.adapters.llm.openai_llm import OpenAILLMAdapter
 from app.adapters.sms.twilio_sms import TwilioSMSAdapter
 from app.adapters.sms.email_sms import EmailSMSAdapter
 from app.adapters.db.repository import PostgresEventRepository
-from app.config.settings import Settings
+from app.config.settings import Settings, get_settings
+from app.core.ports.sms_port import SMSPort
+from app.core.ports.event_repository_port import EventRepositoryPort
+from typing import List, Optional, Tuple
 
 # Agentic system imports
 from app.adapters.agents import (
@@ -27,41 +30,24 @@ from app.adapters.agents.research.web_search_research_agent import WebSearchRese
 from app.adapters.agents.research.knowledge_synthesis_agent import KnowledgeSynthesisAgent
 
 
-def build_event_service() -> EventService:
-    """Build the original (non-agentic) event service."""
-    s = Settings()
-    scraper = HoustonEventsScraper()
-    llm = OpenAILLMAdapter(api_key=s.openai_api_key, model=s.openai_model)
-    
-    # Use email if Gmail credentials are provided, otherwise use Twilio
-    if hasattr(s, 'gmail_address') and s.gmail_address:
+def build_sms_adapter(s: Settings) -> SMSPort:
+    """Use email if Gmail credentials are provided, otherwise use Twilio."""
+    if s.gmail_address:
         print("📧 Using Email for notifications")
-        sms = EmailSMSAdapter(gmail_address=s.gmail_address, gmail_app_password=s.gmail_app_password)
-    else:
-        print("📱 Using Twilio SMS for notifications")
-        sms = TwilioSMSAdapter(account_sid=s.twilio_account_sid, auth_token=s.twilio_auth_token, from_number=s.twilio_from_number)
-    
-    repo = PostgresEventRepository()
-    return EventService(scraper=scraper, llm=llm, sms=sms, repository=repo, sms_recipient=s.sms_recipient, dev_sms_mute=s.dev_sms_mute)
+        return EmailSMSAdapter(gmail_address=s.gmail_address, gmail_app_password=s.gmail_app_password)
+    print("📱 Using Twilio SMS for notifications")
+    return TwilioSMSAdapter(account_sid=s.twilio_account_sid, auth_token=s.twilio_auth_token, from_number=s.twilio_from_number)
 
 
-def build_agentic_event_service() -> AgenticEventService:
+def build_core_agents(s: Settings) -> Tuple[List, List, PromoGeneratorAgent]:
     """
-    Build the agentic event service with multi-agent system.
-    
-    This wires up:
-    - Search agents (Eventbrite, Ticketmaster, Meetup)
-    - Review agents (URL validator, content enricher, relevance scorer, date verifier)
-    - Promo generator agent
-    - Planning agent (orchestrator)
+    Search, review and promo agents shared by the agentic and deep research services.
+    Callers append their own extra search agents (Meetup, Reddit) to the returned list.
     """
-    s = Settings()
-    
     # Build search agents
     search_agents = [
         SerpAPIEventsAgent(s),  # Google Events aggregation - best coverage!
         TicketmasterSearchAgent(s),  # Backup/additional coverage
-        MeetupSearchAgent(s),  # Community events
         # Eventbrite removed - they deprecated public event search in 2019
     ]
     
@@ -91,6 +77,44 @@ def build_agentic_event_service() -> AgenticEventService:
         model=s.openai_model,
         temperature=s.openai_temperature
     )
+    return search_agents, review_agents, promo_agent
+
+
+def build_event_service(
+    settings: Optional[Settings] = None,
+    sms: Optional[SMSPort] = None,
+    repository: Optional[EventRepositoryPort] = None,
+) -> EventService:
+    """Build the original (non-agentic) event service."""
+    s = settings or get_settings()
+    scraper = HoustonEventsScraper()
+    llm = OpenAILLMAdapter(api_key=s.openai_api_key, model=s.openai_model)
+    sms = sms or build_sms_adapter(s)
+    
+    repo = repository or PostgresEventRepository()
+    return EventService(scraper=scraper, llm=llm, sms=sms, repository=repo, sms_recipient=s.sms_recipient, dev_sms_mute=s.dev_sms_mute)
+
+
+def build_agentic_event_service(
+    settings: Optional[Settings] = None,
+    sms: Optional[SMSPort] = None,
+    repository: Optional[EventRepositoryPort] = None,
+) -> AgenticEventService:
+    """
+    Build the agentic event service with multi-agent system.
+    
+    This wires up:
+    - Search agents (Eventbrite, Ticketmaster, Meetup)
+    - Review agents (URL validator, content enricher, relevance scorer, date verifier)
+    - Promo generator agent
+    - Planning agent (orchestrator)
+    
+    Pass ``settings``/``sms``/``repository`` to reuse the app's instances (see create_app).
+    """
+    s = settings or get_settings()
+    
+    search_agents, review_agents, promo_agent = build_core_agents(s)
+    search_agents.append(MeetupSearchAgent(s))  # Community events
     
     # Build planning agent (orchestrator)
     planning_agent = PlanningAgent(
@@ -102,19 +126,10 @@ def build_agentic_event_service() -> AgenticEventService:
     )
     
     # Build SMS adapter
-    if hasattr(s, 'gmail_address') and s.gmail_address:
-        print("📧 Using Email for notifications")
-        sms = EmailSMSAdapter(gmail_address=s.gmail_address, gmail_app_password=s.gmail_app_password)
-    else:
-        print("📱 Using Twilio SMS for notifications")
-        sms = TwilioSMSAdapter(
-            account_sid=s.twilio_account_sid,
-            auth_token=s.twilio_auth_token,
-            from_number=s.twilio_from_number
-        )
+    sms = sms or build_sms_adapter(s)
     
     # Build repository
-    repo = PostgresEventRepository()
+    repo = repository or PostgresEventRepository()
     
     # Build and return the agentic service
     return AgenticEventService(
@@ -1,22 +1,12 @@
 """Deep Research Service Builder - Temporary until we merge into di.py"""
 
 from app.core.services.agentic_event_service import AgenticEventService
-from app.adapters.sms.twilio_sms import TwilioSMSAdapter
-from app.adapters.sms.email_sms import EmailSMSAdapter
 from app.adapters.db.repository import PostgresEventRepository
-from app.config.settings import Settings
+from app.config.settings import get_settings
+from app.core.di import build_core_agents, build_sms_adapter
 
 # Agentic system imports
-from app.adapters.agents import (
-    TicketmasterSearchAgent,
-    SerpAPIEventsAgent,
-    WebSearchEnricherAgent,
-    ContentEnricherAgent,
-    RelevanceScoreAgent,
-    DateVerificationAgent,
-    PromoGeneratorAgent,
-    PlanningAgent,
-)
+from app.adapters.agents import PlanningAgent
 
 # Deep research imports
 from app.adapters.agents.reddit_events_agent import RedditEventsAgent
@@ -40,44 +30,14 @@ def build_deep_research_service(include_reddit: bool = False) -> AgenticEventSer
     Args:
         include_reddit: If True, includes Reddit /r/houston events (default: False)
     """
-    s = Settings()
+    s = get_settings()
     
-    # Build search agents
-    search_agents = [
-        SerpAPIEventsAgent(s),  # Google Events aggregation
-        TicketmasterSearchAgent(s),  # Major events
-    ]
+    search_agents, review_agents, promo_agent = build_core_agents(s)
     
     # Optionally add Reddit (can be noisy, so opt-in)
     if include_reddit:
         search_agents.append(RedditEventsAgent())  # /r/houston weekly threads
     
-    # Build review agents
-    review_agents = [
-        RelevanceScoreAgent(),
-        DateVerificationAgent(),
-    ]
-    
-    # Add enrichers if keys available
-    if s.serpapi_key and s.openai_api_key:
-        review_agents.append(WebSearchEnricherAgent(
-            serpapi_key=s.serpapi_key,
-            openai_api_key=s.openai_api_key
-        ))
-    
-    if s.openai_api_key:
-        review_agents.append(ContentEnricherAgent(
-            openai_api_key=s.openai_api_key,
-            model=s.openai_model
-        ))
-    
-    # Build promo generator
-    promo_agent = PromoGeneratorAgent(
-        api_key=s.openai_api_key,
-        model=s.openai_model,
-        temperature=s.openai_temperature
-    )
-    
     # Build research agents - NEW!
     entity_extractor = EntityExtractionAgent(s.openai_api_key)
     query_generator = QueryGenerationAgent(s.openai_api_key)  # AI-powered query generation!
@@ -99,12 +59,7 @@ def build_deep_research_service(include_reddit: bool = False) -> AgenticEventSer
     )
     
     # Build SMS adapter
-    if hasattr(s, 'gmail_address') and s.gmail_address:
-        print("📧 Using Email for notifications")
-        sms = EmailSMSAdapter(gmail_address=s.gmail_address, gmail_app_password=s.gmail_app_password)
-    else:
-        print("📱 Using Twilio SMS for notifications")
-        sms = TwilioSMSAdapter(account_sid=s.twilio_account_sid, auth_token=s.twilio_auth_token, from_number=s.twilio_from_number)
+    sms = build_sms_adapter(s)
     
     repo = PostgresEventRepository()
     
@@ -6,6 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Dict, Optional, Any
 from pydantic import BaseModel, Field, HttpUrl
+from pydantic.dataclasses import dataclass
 
 from app.core.domain.models import Event
 
@@ -28,7 +29,9 @@ class AgentPhase(str, Enum):
     FAILED = "failed"
 
 
-class Observation(BaseModel):
+# Created for every REACT step, so it's a slotted (no per-instance __dict__) validated dataclass
+@dataclass(slots=True, kw_only=True)
+class Observation:
     """A single observation in the REACT loop."""
     timestamp: datetime = Field(default_factory=datetime.now)
     agent: str
@@ -0,0 +1,87 @@
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+
+# Keyword lists for tagging scraped events with display categories
+CATEGORY_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("cycling", ("bike", "cycling", "cycle", "ride", "pedal", "cyclist", "bicycle")),
+    ("outdoor", ("hike", "trail", "park", "outdoor", "nature", "kayak", "run", "walk", "camping", "fishing")),
+    ("music", ("concert", "music", "band", "show", "live music", "performance", "symphony", "jazz", "rock", "hip hop", "dj", "singer", "festival")),
+    ("food", ("food", "dining", "restaurant", "brunch", "dinner", "cooking", "culinary", "wine", "beer", "tasting")),
+    ("arts", ("art", "museum", "gallery", "exhibition", "theater", "theatre", "play", "comedy", "film", "movie")),
+    ("family", ("family", "kids", "children", "playground")),
+    ("sports", ("sports", "game", "match", "basketball", "football", "baseball", "soccer", "hockey")),
+)
+
+# Web UI filter tags -> substrings of the lower-cased title + description
+FILTER_TAG_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "cycling": ("cycling", "bike", "biking", "bicycle", "mtb", "ride", "critical mass"),
+    "outdoor": ("outdoor", "park", "hike", "trail", "run", "nature", "bayou", "memorial park"),
+}
+
+
+_WORD = re.compile(r"\w+")
+
+
+def _base_forms(word: str) -> List[str]:
+    """Likely base forms of an inflected word, so "concerts"/"running"/"musical" hit their keywords."""
+    forms = []
+    if word.endswith("s"):
+        forms.append(word[:-1])  # concerts -> concert
+    if word.endswith("ing") and len(word) > 5:
+        stem = word[:-3]
+        forms += [stem, stem + "e"]  # walking -> walk, hiking -> hike
+        if stem[-1] == stem[-2]:
+            forms.append(stem[:-1])  # running -> run
+    if word.endswith("al") and len(word) > 4:
+        forms.append(word[:-2])  # musical -> music
+    return forms
+
+
+class KeywordTagger:
+    """
+    Tags text with every category whose keywords appear in it as whole words.
+
+    Single-word keywords are frozen into one set per category and matched with a set
+    intersection against the text's words plus their base forms (plural, -ing, -al);
+    multi-word phrases ("live music", "dog-friendly") fall back to a substring check.
+    """
+
+    def __init__(self, table: Sequence[Tuple[str, Sequence[str]]]):
+        self._words: Tuple[Tuple[str, FrozenSet[str]], ...] = tuple(
+            (cat, frozenset(w for w in words if _WORD.fullmatch(w))) for cat, words in table
+        )
+        self._phrases: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+            (cat, tuple(w for w in words if not _WORD.fullmatch(w))) for cat, words in table
+        )
+
+    def tag(self, *texts: str) -> List[str]:
+        """Return categories matched in any of ``texts``, in table order."""
+        words = set()
+        for text in texts:
+            words.update(_WORD.findall(text))
+        # Fold inflections so "trails" / "running" / "musical" still hit "trail" / "run" / "music"
+        words.update([form for w in words for form in _base_forms(w)])
+        return [
+            cat
+            for (cat, keywords), (_, phrases) in zip(self._words, self._phrases)
+            if not keywords.isdisjoint(words) or any(p in text for p in phrases for text in texts)
+        ]
+
+
+_TAGGER = KeywordTagger(CATEGORY_KEYWORDS)
+
+
+@lru_cache(maxsize=4096)
+def _categorize_cached(title_lower: str, desc_lower: str) -> Tuple[str, ...]:
+    # Identical titles recur across sources (SerpAPI re-lists Ticketmaster/Meetup), so memoize
+    return tuple(_TAGGER.tag(title_lower, desc_lower))
+
+
+def categorize(title: str, description: str = "") -> List[str]:
+    """Intelligently categorize events based on title and description."""
+    if not title and not description:
+        return []
+    # Lower and scan each field on its own rather than allocating "title description"
+    # Return a fresh list: callers append source-specific categories
+    return list(_categorize_cached(title.lower(), (description or "").lower()))
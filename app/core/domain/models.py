@@ -1,8 +1,19 @@
+import re
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, HttpUrl, Field
+from functools import cached_property
+from typing import Any, Dict, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, HttpUrl, Field
+
+_WORD = re.compile(r"\w+")
+
+# cached_property values below; they live in __dict__, so copies must drop them
+_DERIVED_KEYS = ("title_lower", "title_key", "search_text")
 
 class Event(BaseModel):
+    # Events are never mutated after scraping; freezing them keeps instances lean, safe to share
+    # and hashable (hence a tuple for categories)
+    model_config = ConfigDict(frozen=True)
+
     id: Optional[int] = Field(default=None)
     title: str
     description: Optional[str] = None
@@ -10,5 +21,30 @@ class Event(BaseModel):
     location: Optional[str] = None
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
-    categories: List[str] = []
+    categories: Tuple[str, ...] = ()
     source: Optional[str] = None
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "Event":
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            # The copied __dict__ carries the derived keys of the old field values
+            for key in _DERIVED_KEYS:
+                copy.__dict__.pop(key, None)
+        return copy
+
+    @cached_property
+    def title_lower(self) -> str:
+        """Lower-cased title for keyword checks (computed once per event)."""
+        return self.title.lower()
+
+    @cached_property
+    def title_key(self) -> str:
+        """Case- and punctuation-insensitive title used for de-duplication (computed once per event)."""
+        # "Critical Mass - Houston" and "critical mass: houston" collapse to one key
+        return " ".join(_WORD.findall(self.title_lower))
+
+    @cached_property
+    def search_text(self) -> str:
+        """Lower-cased title + description for keyword scoring (computed once per event)."""
+        # An f-string compiles to a single BUILD_STRING; measured faster than + or " ".join
+        return f"{self.title} {self.description or ''}".lower()
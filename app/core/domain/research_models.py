@@ -1,51 +1,69 @@
 """Domain models for the deep research system."""
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Literal
-from pydantic import BaseModel, Field
+from functools import cached_property
+from typing import Annotated, List, Dict, Any, Optional, Literal, get_args
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
+# Shared field constraints; the adapters check a bare value against them
+Confidence = Annotated[float, Field(ge=0.0, le=1.0)]
+Priority = Annotated[int, Field(ge=1, le=10)]
+CONFIDENCE_ADAPTER = TypeAdapter(Confidence)
+PRIORITY_ADAPTER = TypeAdapter(Priority)
 
-class Entity(BaseModel):
+EntityType = Literal["artist", "venue", "organizer", "topic", "genre"]
+QueryType = Literal[
+    "biographical",      # About a person's life/career
+    "contextual",        # General background/context
+    "current",           # Recent/current information
+    "relational",        # Relationships between entities
+    "cultural_impact",   # Cultural significance/impact
+    "venue_history",     # Venue background/history
+    "genre_overview",    # Genre/style information
+    "collaboration",     # Collaborative work
+    "historical",        # Historical background/context
+    "awards"             # Awards, accolades, achievements
+]
+# Same values as sets, for membership checks outside pydantic validation
+ALL_ENTITY_TYPES = frozenset(get_args(EntityType))
+ALL_QUERY_TYPES = frozenset(get_args(QueryType))
+
+
+class _ResearchModel(BaseModel):
+    # Research records are built once per agent step and never edited; use model_copy(update=...)
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class Entity(_ResearchModel):
     """An entity extracted from an event."""
     name: str
-    type: Literal["artist", "venue", "organizer", "topic", "genre"]
-    confidence: float = Field(ge=0.0, le=1.0, default=1.0)
+    type: EntityType
+    confidence: Confidence = 1.0
     aliases: List[str] = []
     metadata: Dict[str, Any] = {}
 
 
-class ResearchQuery(BaseModel):
+class ResearchQuery(_ResearchModel):
     """A research query to investigate."""
     query: str
-    priority: int = Field(ge=1, le=10)
+    priority: Priority
     entity_name: Optional[str] = None
-    query_type: Literal[
-        "biographical",      # About a person's life/career
-        "contextual",        # General background/context
-        "current",           # Recent/current information
-        "relational",        # Relationships between entities
-        "cultural_impact",   # Cultural significance/impact
-        "venue_history",     # Venue background/history
-        "genre_overview",    # Genre/style information
-        "collaboration",     # Collaborative work
-        "historical",        # Historical background/context
-        "awards"             # Awards, accolades, achievements
-    ] = "contextual"
+    query_type: QueryType = "contextual"
     executed: bool = False
     agent_results: List[str] = []  # Agent IDs that researched this
 
 
-class ResearchResult(BaseModel):
+class ResearchResult(_ResearchModel):
     """Result from a research agent."""
     agent_id: str
     query: ResearchQuery
     sources: List[str]  # URLs or source names
     facts: List[str]    # Key facts discovered
     snippets: List[str] = []  # Text snippets
-    confidence: float = Field(ge=0.0, le=1.0)
+    confidence: Confidence
     execution_time: float = 0.0
 
 
-class EventResearch(BaseModel):
+class EventResearch(_ResearchModel):
     """Complete research for a single event."""
     event_title: str  # Reference to the event
     entities: List[Entity]
@@ -56,9 +74,16 @@ class EventResearch(BaseModel):
     overall_confidence: float = 0.8
     research_timestamp: datetime = Field(default_factory=datetime.now)
 
+    @cached_property
+    def total_facts(self) -> int:
+        """Facts across all results (computed once; results aren't changed after synthesis)."""
+        # Plain property, not a computed field: dumps must validate back under extra="forbid"
+        return sum(len(r.facts) for r in self.results)
+
 
-class ResearchState(BaseModel):
+class ResearchState(_ResearchModel):
     """State for the research phase."""
+    model_config = ConfigDict(frozen=False)  # Running counters
     total_entities_found: int = 0
     total_queries_executed: int = 0
     total_facts_discovered: int = 0
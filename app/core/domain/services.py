@@ -1,6 +1,14 @@
+from functools import lru_cache
 from typing import List
 from .models import Event
 
+# C-level Aho-Corasick matcher (optional - falls back to per-keyword substring checks)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Keyword lists for prioritization and categorization
 CYCLING = ["cycling","bike","biking","bicycle","mtb","ride","critical mass"]
 OUTDOOR = ["outdoor","park","hike","trail","run","nature","bayou","memorial park","kayak","paddle"]
@@ -9,6 +17,70 @@ DOG_FRIENDLY = ["dog","dog-friendly","pet","pet-friendly","pup","canine","bark",
 COUPLE_ACTIVITIES = ["wine","brewery","beer","cocktail","tasting","comedy","trivia","art walk","gallery","date night","romantic"]
 KID_FOCUSED = ["kids","children","family fun","toddler","playground","bounce house","story time","baby"]
 
+# Points per category, each counted at most once per event
+SCORE_WEIGHTS = [
+    (CYCLING, 10),  # Cycling is KING! OH YEAH!
+    (COUPLE_ACTIVITIES, 9),  # Couple-friendly activities - SECOND HIGHEST! DIG IT!
+    (MUSIC, 8),  # Music and concerts - high priority
+    (DOG_FRIENDLY, 7),  # Dog-friendly gets a boost!
+    (OUTDOOR, 5),  # Outdoor activities
+    (KID_FOCUSED, -5),  # Penalize kid-focused events
+]
+
+
+def _build_automaton():
+    """One automaton over every keyword; each hit yields its category bit."""
+    automaton = ahocorasick.Automaton()
+    for cat_id, (keywords, _) in enumerate(SCORE_WEIGHTS):
+        for k in keywords:
+            # Keywords shared by two lists keep the first (higher-weight) category
+            if k not in automaton:
+                automaton.add_word(k, 1 << cat_id)
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Score for every possible category mask, so scoring is one index instead of a bit loop
+SCORE_LUT = tuple(
+    sum(w for i, (_, w) in enumerate(SCORE_WEIGHTS) if mask >> i & 1)
+    for mask in range(1 << len(SCORE_WEIGHTS))
+)
+
+# Fallback table: drop keywords containing a shorter one from the same category
+# ("live music" can't hit unless "music" does), leaving fewer substring scans
+_SUBSTRING_KEYWORDS = [
+    (1 << cat_id, tuple(k for k in keywords if not any(o != k and o in k for o in keywords)))
+    for cat_id, (keywords, _) in enumerate(SCORE_WEIGHTS)
+]
+
+
+@lru_cache(maxsize=2048)
+def _classify_text(txt: str) -> int:
+    # Events are scored by prioritize_events and again by the LLM summary, so memoize
+    mask = 0
+    if _AUTOMATON is not None:
+        # Single linear pass over txt, tagging every category at once
+        for _, cat in _AUTOMATON.iter(txt):
+            mask |= cat
+        return mask
+    # str.__contains__ beats both a regex alternation and a pure-Python trie walk here
+    for cat, keywords in _SUBSTRING_KEYWORDS:
+        if any(k in txt for k in keywords):
+            mask |= cat
+    return mask
+
+
+def classify(e: Event) -> int:
+    """Bitmask of the SCORE_WEIGHTS categories an event matches (bit i = row i)."""
+    return _classify_text(e.search_text)
+
+
+def score_event(e: Event) -> int:
+    """Priority score for an event; higher means a better fit (see prioritize_events)."""
+    return SCORE_LUT[classify(e)]
+
 def prioritize_events(events: List[Event]) -> List[Event]:
     """
     Prioritize events for a mid-life childless couple who loves:
@@ -19,34 +91,5 @@ def prioritize_events(events: List[Event]) -> List[Event]:
     5. Outdoor activities
     6. De-prioritize kid-focused events
     """
-    def score(e: Event) -> int:
-        txt = f"{e.title} {e.description or ''}".lower()
-        s = 0
-        
-        # Cycling is KING! OH YEAH!
-        if any(k in txt for k in CYCLING):
-            s += 10
-        
-        # Couple-friendly activities - SECOND HIGHEST! DIG IT!
-        if any(k in txt for k in COUPLE_ACTIVITIES):
-            s += 9
-        
-        # Music and concerts - high priority
-        if any(k in txt for k in MUSIC):
-            s += 8
-        
-        # Dog-friendly gets a boost!
-        if any(k in txt for k in DOG_FRIENDLY):
-            s += 7
-        
-        # Outdoor activities
-        if any(k in txt for k in OUTDOOR):
-            s += 5
-        
-        # Penalize kid-focused events
-        if any(k in txt for k in KID_FOCUSED):
-            s -= 5
-        
-        return s
-    
-    return sorted(events, key=score, reverse=True)
+    # key= already scores each event once; sorted() is stable, so ties keep input order
+    return sorted(events, key=score_event, reverse=True)
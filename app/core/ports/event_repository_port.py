@@ -1,6 +1,7 @@
-from typing import List, Protocol
+from typing import List, Optional, Protocol
 from app.core.domain.models import Event
 
 class EventRepositoryPort(Protocol):
     async def save_events(self, events: List[Event]) -> None: ...
     async def get_latest_events(self, limit: int = 20) -> List[Event]: ...
+    async def search_events(self, q: Optional[str], tags: List[str], limit: int = 50) -> List[Event]: ...
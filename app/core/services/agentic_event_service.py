@@ -1,13 +1,14 @@
 """
 Agentic Event Service - Uses multi-agent system for event discovery and promo generation.
 """
-from typing import List
+from typing import Iterator, List
 
 from app.core.domain.models import Event
 from app.core.domain.agent_models import PlanningState, AgentPhase
 from app.core.ports.agent_port import PlanningAgentPort
 from app.core.ports.sms_port import SMSPort
 from app.core.ports.event_repository_port import EventRepositoryPort
+from app.core.services.event_service import format_event_listing
 
 
 class AgenticEventService:
@@ -96,7 +97,7 @@ class AgenticEventService:
             await self.repository.save_events(events_to_save)
             print(f"💾 Saved {len(events_to_save)} events to repository")
         
-        # Send SMS/Email (skip only in dry-run mode, NOT in no-db mode)
+        # Send SMS/Email only after the save succeeded (skip only in dry-run mode, NOT in no-db mode)
         if self.dry_run:
             print(f"🧪 [DRY RUN] Skipping SMS to {self.sms_recipient}")
         elif not self.dev_sms_mute:
@@ -146,80 +147,39 @@ class AgenticEventService:
         return full_message
     
     def _format_event_listing(self, events: List[Event]) -> str:
-        """Format events into a plain text listing."""
-        if not events:
-            return ""
-        
-        listing_lines = [
-            "\n\n" + "=" * 60,
-            "COMPLETE EVENT LISTING",
-            "=" * 60,
-            ""
-        ]
-        
-        for idx, event in enumerate(events, 1):
-            listing_lines.append(f"{idx}. {event.title.upper()}")
-            
-            if event.url:
-                listing_lines.append(f"   {event.url}")
-            
-            details = []
-            if event.location:
-                details.append(f"Location: {event.location}")
-            if event.start_time:
-                time_str = event.start_time.strftime("%a, %b %d at %I:%M %p")
-                details.append(f"Time: {time_str}")
-            if details:
-                listing_lines.append(f"   {' | '.join(details)}")
-            
-            if event.categories:
-                cats = ", ".join(event.categories)
-                listing_lines.append(f"   Categories: {cats}")
-            
-            listing_lines.append("")
-        
-        listing_lines.append("=" * 60)
-        
-        return "\n".join(listing_lines)
+        """Format events into a plain text listing (same layout as the legacy flow)."""
+        return format_event_listing(events)
+    
+    def _iter_scratchpad_lines(self, state: PlanningState) -> Iterator[str]:
+        """Yield one line per scratchpad field; shared by the message and console output."""
+        for i, obs in enumerate(state.scratchpad, 1):
+            yield f"[{i}] {obs.agent} @ {obs.timestamp.strftime('%H:%M:%S')}"
+            yield f"    💭 Thought: {obs.thought}"
+            if obs.action:
+                yield f"    🎯 Action: {obs.action}"
+            if obs.result:
+                yield f"    👁️  Observation: {obs.result}"
+            yield f"    📊 Confidence: {obs.confidence:.2f}"
+            yield ""
     
     def _format_scratchpad(self, state: PlanningState) -> str:
         """Format the planning agent's scratchpad for inclusion in the message."""
-        lines = [
+        return "\n".join([
             "\n\n" + "=" * 60,
             "🤖 AGENT REASONING TRACE (How We Did It!)",
             "=" * 60,
-            ""
-        ]
-        
-        for i, obs in enumerate(state.scratchpad, 1):
-            lines.append(f"[{i}] {obs.agent} @ {obs.timestamp.strftime('%H:%M:%S')}")
-            lines.append(f"    💭 Thought: {obs.thought}")
-            if obs.action:
-                lines.append(f"    🎯 Action: {obs.action}")
-            if obs.result:
-                lines.append(f"    👁️  Observation: {obs.result}")
-            lines.append(f"    📊 Confidence: {obs.confidence:.2f}")
-            lines.append("")
-        
-        lines.append("=" * 60)
-        
-        return "\n".join(lines)
+            "",
+            *self._iter_scratchpad_lines(state),
+            "=" * 60,
+        ])
     
     def _print_scratchpad(self, state: PlanningState):
         """Print the planning agent's scratchpad for transparency."""
-        print("\n" + "="*80)
-        print("📝 PLANNING AGENT SCRATCHPAD (REACT TRACE)")
-        print("="*80 + "\n")
-        
-        for i, obs in enumerate(state.scratchpad, 1):
-            print(f"[{i}] {obs.agent} @ {obs.timestamp.strftime('%H:%M:%S')}")
-            print(f"    💭 Thought: {obs.thought}")
-            if obs.action:
-                print(f"    🎯 Action: {obs.action}")
-            if obs.result:
-                print(f"    👁️  Observation: {obs.result}")
-            print(f"    📊 Confidence: {obs.confidence:.2f}")
-            print()
-        
-        print("="*80 + "\n")
-
+        # One write for the whole trace instead of a print() per line
+        print("\n".join([
+            "\n" + "=" * 80,
+            "📝 PLANNING AGENT SCRATCHPAD (REACT TRACE)",
+            "=" * 80 + "\n",
+            *self._iter_scratchpad_lines(state),
+            "=" * 80 + "\n",
+        ]))
@@ -4,8 +4,16 @@ from app.core.ports.scraper_port import ScraperPort
 from app.core.ports.llm_port import LLMPort
 from app.core.ports.sms_port import SMSPort
 from app.core.ports.event_repository_port import EventRepositoryPort
+import re
 from typing import List
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+CENTRAL_TZ = ZoneInfo("America/Chicago")  # Houston time
+TIME_FMT = "%a, %b %d at %I:%M %p"
+
+# Undated "fest" events are usually stale listings; matched as substrings of the lowered title
+STALE_RE = re.compile("|".join(map(re.escape, ["bike fest", "music fest", "food fest", "festival", "annual"])))
 
 def format_event_listing(events: List[Event]) -> str:
     """Format events into a plain text listing with titles and links."""
@@ -32,7 +40,7 @@ def format_event_listing(events: List[Event]) -> str:
         if event.location:
             details.append(f"Location: {event.location}")
         if event.start_time:
-            time_str = event.start_time.strftime("%a, %b %d at %I:%M %p")
+            time_str = event.start_time.strftime(TIME_FMT)
             details.append(f"Time: {time_str}")
         if details:
             listing_lines.append(f"   {' | '.join(details)}")
@@ -66,12 +74,10 @@ class EventService:
         
         # Filter events to only include those happening in the next 3 days
         # AND remove events with suspicious/generic titles (likely old/stale data)
-        from zoneinfo import ZoneInfo
-        now = datetime.now(ZoneInfo("America/Chicago"))  # Houston time
+        now = datetime.now(CENTRAL_TZ)
         three_days = now + timedelta(days=3)
         
         filtered_events = []
-        stale_keywords = ["bike fest", "music fest", "food fest", "festival", "annual"]
         
         for event in events:
             # If event has a start_time, check if it's within next 3 days
@@ -79,7 +85,7 @@ class EventService:
                 # Make timezone-aware if needed (assume Central if naive)
                 event_time = event.start_time
                 if event_time.tzinfo is None:
-                    event_time = event_time.replace(tzinfo=ZoneInfo("America/Chicago"))
+                    event_time = event_time.replace(tzinfo=CENTRAL_TZ)
                 
                 if now <= event_time <= three_days:
                     filtered_events.append(event)
@@ -87,8 +93,7 @@ class EventService:
                     print(f"⏭️  Filtered out (wrong date): {event.title} - {event.start_time}")
             else:
                 # If no start_time, be cautious with "fest" events (often stale)
-                title_lower = event.title.lower()
-                if any(keyword in title_lower for keyword in stale_keywords):
+                if STALE_RE.search(event.title_lower):
                     print(f"⚠️  Filtered out (suspicious/stale): {event.title}")
                 else:
                     # Include events without dates if they're not suspicious
@@ -105,6 +110,7 @@ class EventService:
         event_listing = format_event_listing(prioritized)
         full_message = summary + event_listing
         
+        # Save before notifying: a failed save must not leave a message already sent
         await self.repository.save_events(prioritized)
         if not self.dev_sms_mute:
             # Pass events and promo for HTML email rendering
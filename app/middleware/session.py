@@ -1,9 +1,9 @@
 from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi import Request
-from app.config.settings import Settings
+from app.config.settings import get_settings
 from app.utils.security import verify_session_payload, create_session_payload
 
-settings = Settings()
+settings = get_settings()
 
 class SessionMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
@@ -0,0 +1,21 @@
+"""
+Event-loop runner for entry points that uvicorn doesn't start (CLI job, Celery task).
+"""
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+# uvloop ships with uvicorn[standard]; fall back to the stdlib loop where it isn't built (Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """asyncio.run(), on uvloop's libuv-based loop when it's installed."""
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(main)
+    return asyncio.run(main)
@@ -0,0 +1,100 @@
+"""
+Celery app for running the agentic workflow and the daily job outside the API process.
+
+    celery -A app.workers.celery_app worker -Q agentic
+
+`run_daily_task.delay({"deep_research": True})` runs run_daily_job with those flags;
+retries replay the search sources that already succeeded and never re-send a delivered
+email/SMS (see source_checkpoint). Only TRANSIENT_ERRORS are retried.
+
+Optional: when celery isn't installed or EVENTS_REDIS_URL is unset, `run_agentic_flow`
+is None and the API falls back to running the flow in-process (BackgroundTasks).
+"""
+import httpx
+import openai
+from pydantic_ai.exceptions import ModelAPIError
+from app.utils.aio import run
+from app.config.settings import get_settings
+from app.core.di import build_agentic_event_service
+from app.workers.run_daily_job import release_job_resources, parse_flags, run_daily
+from app.workers.source_checkpoint import checkpoint_key, checkpoint_search_agents, notify_once
+
+try:
+    from celery import Celery
+    from redis.asyncio import Redis
+    CELERY_AVAILABLE = True
+except ImportError:
+    CELERY_AVAILABLE = False
+
+# Dedicated queue so long LLM workflows never sit behind (or in front of) other work
+AGENTIC_QUEUE = "agentic"
+
+# Retry only what a second attempt can fix: network, rate limits and provider 5xx/outages.
+# Anything else (bad data, DB errors, bugs) fails the task instead of re-running the flow.
+TRANSIENT_ERRORS = (
+    httpx.TransportError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+    ModelAPIError,
+    TimeoutError,
+)
+
+celery_app = None
+run_agentic_flow = None
+run_daily_task = None
+
+
+async def _run_agentic_flow(task_id: str) -> None:
+    # Built per task: every task runs on a new loop, and the pooled asyncpg/httpx
+    # connections from the previous task's loop can't be reused
+    key = checkpoint_key(task_id, {"agentic": True})
+    redis = Redis.from_url(_redis_url)
+    service = build_agentic_event_service()
+    notify_once(service, redis, key)
+    try:
+        await service.run_daily_event_flow()
+        await redis.delete(key)
+    finally:
+        await release_job_resources(service)
+        await redis.aclose()
+
+
+async def _run_daily(flags: dict, task_id: str) -> None:
+    # Flag names as in parse_flags' namespace, e.g. {"deep_research": True, "no_db": True}
+    argv = [f"--{name.replace('_', '-')}" for name, on in flags.items() if on]
+    key = checkpoint_key(task_id, flags)
+    redis = Redis.from_url(_redis_url)
+
+    def on_built(service) -> None:
+        checkpoint_search_agents(service, redis, key)
+        notify_once(service, redis, key)
+
+    try:
+        await run_daily(parse_flags(argv), on_built=on_built)
+        # Only retries of this task may replay its sources
+        await redis.delete(key)
+    finally:
+        await redis.aclose()
+
+
+_redis_url = get_settings().redis_url
+if CELERY_AVAILABLE and _redis_url:
+    celery_app = Celery("htown", broker=_redis_url, backend=_redis_url)
+    celery_app.conf.task_routes = {
+        "app.workers.celery_app.run_agentic_flow": {"queue": AGENTIC_QUEUE},
+        "app.workers.celery_app.run_daily_task": {"queue": AGENTIC_QUEUE},
+    }
+
+    @celery_app.task(bind=True, max_retries=3, autoretry_for=TRANSIENT_ERRORS, retry_backoff=True)
+    def run_agentic_flow(self):
+        """Run the full agentic event flow; retried with backoff on LLM/API flakiness."""
+        run(_run_agentic_flow(self.request.id))
+
+    @celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+    def run_daily_task(self, flags: dict):
+        """Run the daily job; a retry only re-runs the search sources that didn't finish."""
+        try:
+            run(_run_daily(flags, self.request.id))
+        except TRANSIENT_ERRORS as exc:
+            raise self.retry(exc=exc)
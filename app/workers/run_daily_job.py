@@ -1,13 +1,62 @@
-import asyncio
-import sys
+import argparse
+from typing import Callable, List, Optional
 from app.core.di import build_event_service, build_agentic_event_service
 from app.core.di_deep_research import build_deep_research_service
+from app.adapters.scraping.http_client import close_client
+from app.config.settings import configure_logging
+from app.utils.aio import run
+from app.adapters.db.session import engine
 
 
-async def run_daily():
+# (flag attribute, banner, builder, builder kwargs); checked in order
+MODE_TABLE = [
+    ("deep_research", "🔬 Using DEEP RESEARCH multi-agent system (Agentic + Research)\n", build_deep_research_service, {}),
+    ("agentic", "🤖 Using AGENTIC multi-agent system\n", build_agentic_event_service, {}),
+    (None, "📋 Using ORIGINAL service\n", build_event_service, {}),
+]
+
+_PARSER = argparse.ArgumentParser(prog="python -m app.workers.run_daily_job", description="Run the daily event flow.")
+_PARSER.add_argument("--agentic", action="store_true", help="use the agentic multi-agent service")
+_PARSER.add_argument("--deep-research", action="store_true", help="use agentic + deep research")
+_PARSER.add_argument("--dry-run", action="store_true", help="don't save to the database or send SMS")
+_PARSER.add_argument("--no-db", action="store_true", help="send email but skip the database")
+_PARSER.add_argument("--reddit", action="store_true", help="include /r/houston events (deep research only)")
+
+
+def parse_flags(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse job flags (sys.argv when ``argv`` is None); unknown flags are an error."""
+    return _PARSER.parse_args(argv)
+
+
+def _mode_banner_lines(dry_run: bool, no_db: bool) -> List[str]:
+    if dry_run:
+        return ["🧪 DRY RUN MODE: Will NOT save to database or send SMS\n"]
+    if no_db:
+        return ["🗄️  NO-DB MODE: Will send email but skip database (no PostgreSQL needed!)\n"]
+    return []
+
+
+async def release_job_resources(service) -> None:
+    """
+    Close everything a freshly built service opened on this event loop.
+
+    Job entry points build the service graph per run (each run gets its own loop), so
+    pooled HTTP/SMTP/DB connections must not outlive the run.
+    """
+    await close_client()
+    sms_close = getattr(getattr(service, "sms", None), "close", None)
+    if sms_close is not None:
+        await sms_close()
+    await engine.dispose()
+
+
+async def run_daily(flags: Optional[argparse.Namespace] = None, on_built: Optional[Callable] = None):
     """
     Run the daily event flow.
     
+    Pass ``flags`` (see parse_flags) to run without reading sys.argv; ``on_built`` is
+    called with the service before the flow starts (the Celery task checkpoints sources there).
+    
     Usage:
         python -m app.workers.run_daily_job                                    # Uses original service
         python -m app.workers.run_daily_job --agentic                          # Uses agentic service
@@ -16,39 +65,29 @@ async def run_daily():
         python -m app.workers.run_daily_job --deep-research --no-db            # Skip DB, send email (no PostgreSQL needed!)
         python -m app.workers.run_daily_job --deep-research --no-db --reddit   # Include Reddit events (opt-in)
     """
-    # Check flags
-    use_agentic = "--agentic" in sys.argv
-    use_deep_research = "--deep-research" in sys.argv
-    dry_run = "--dry-run" in sys.argv
-    no_db = "--no-db" in sys.argv
-    include_reddit = "--reddit" in sys.argv
+    flags = flags or parse_flags()
+    dry_run = flags.dry_run
+    no_db = flags.no_db
+    
+    # First matching flag wins; the last row is the default
+    flag, banner, builder, kwargs = next(
+        mode for mode in MODE_TABLE if mode[0] is None or getattr(flags, mode[0])
+    )
+    # Collect the startup banner and emit it with one print (one write to the log)
+    lines = [banner, *_mode_banner_lines(dry_run, no_db)]
+    if flags.reddit and flag == "deep_research":
+        lines.append("🔴 Including Reddit /r/houston events\n")
+        kwargs = {**kwargs, "include_reddit": True}
+    
+    if flag is None:
+        lines.append("🚀 Starting daily event flow...")
+    print("\n".join(lines))
+    service = builder(**kwargs)
+    if flag is None:
+        print(f"📱 SMS will be sent to: {service.sms_recipient}\n🔇 Dev SMS Mute: {service.dev_sms_mute}")
     
-    if use_deep_research:
-        print("🔬 Using DEEP RESEARCH multi-agent system (Agentic + Research)\n")
-        if dry_run:
-            print("🧪 DRY RUN MODE: Will NOT save to database or send SMS\n")
-        elif no_db:
-            print("🗄️  NO-DB MODE: Will send email but skip database (no PostgreSQL needed!)\n")
-        if include_reddit:
-            print("🔴 Including Reddit /r/houston events\n")
-        service = build_deep_research_service(include_reddit=include_reddit)
-    elif use_agentic:
-        print("🤖 Using AGENTIC multi-agent system\n")
-        if dry_run:
-            print("🧪 DRY RUN MODE: Will NOT save to database or send SMS\n")
-        elif no_db:
-            print("🗄️  NO-DB MODE: Will send email but skip database (no PostgreSQL needed!)\n")
-        service = build_agentic_event_service()
-    else:
-        print("📋 Using ORIGINAL service\n")
-        if dry_run:
-            print("🧪 DRY RUN MODE: Will NOT save to database or send SMS\n")
-        elif no_db:
-            print("🗄️  NO-DB MODE: Will send email but skip database (no PostgreSQL needed!)\n")
-        print("🚀 Starting daily event flow...")
-        service = build_event_service()
-        print(f"📱 SMS will be sent to: {service.sms_recipient}")
-        print(f"🔇 Dev SMS Mute: {service.dev_sms_mute}")
+    if on_built is not None:
+        on_built(service)
     
     # Set flags on service
     if dry_run:
@@ -56,13 +95,17 @@ async def run_daily():
     if no_db:
         service.no_db = True
     
-    summary = await service.run_daily_event_flow()
+    try:
+        summary = await service.run_daily_event_flow()
+    finally:
+        await release_job_resources(service)
     
-    if not use_agentic and not use_deep_research:
+    if flag is None:
         print('✅ Daily summary:\n', summary)
     
     print("\n🎉 Job completed!")
 
 
 if __name__ == '__main__':
-    asyncio.run(run_daily())
+    configure_logging()
+    run(run_daily())
@@ -0,0 +1,101 @@
+"""
+Per-source checkpoints for retried daily runs.
+
+Each search agent's successful result is stored in the Redis hash
+``checkpoint:<task id>:<flags>`` (field = agent name), so a retried task replays the
+sources that already succeeded and only re-runs the one that failed (e.g. a transient
+Ticketmaster 429). The Celery task id is stable across retries but new for every run,
+so a manual re-run always searches again; the task deletes the hash once it succeeds.
+
+The same hash records a delivered email/SMS, so a retry never sends the message twice.
+"""
+from typing import List, Optional
+from app.core.domain.agent_models import SearchAgentResult
+from app.core.ports.agent_port import SearchAgentPort
+
+# Safety net for hashes left behind by runs that exhausted their retries
+CHECKPOINT_TTL_SECONDS = 24 * 3600
+
+# Hash field set once this task's email/SMS went out (can't clash with an agent name)
+NOTIFIED_FIELD = "__notified__"
+
+
+def checkpoint_key(task_id: str, flags: dict) -> str:
+    """Redis hash holding one task's per-source results, e.g. ``checkpoint:<id>:deep_research+no_db``."""
+    mode = "+".join(sorted(name for name, on in flags.items() if on)) or "default"
+    return f"checkpoint:{task_id}:{mode}"
+
+
+class CheckpointedSearchAgent(SearchAgentPort):
+    """Wraps a search agent; replays its checkpointed result instead of calling the API again."""
+
+    def __init__(self, agent: SearchAgentPort, redis, key: str):
+        self._agent = agent
+        self._redis = redis  # redis.asyncio.Redis
+        self._key = key
+
+    def get_agent_name(self) -> str:
+        return self._agent.get_agent_name()
+
+    async def search_events(self) -> SearchAgentResult:
+        name = self.get_agent_name()
+        cached = await self._redis.hget(self._key, name)
+        if cached is not None:
+            print(f"♻️  {name}: reusing checkpointed result")
+            return SearchAgentResult.model_validate_json(cached)
+
+        result = await self._agent.search_events()
+        if result.success:
+            await self._redis.hset(self._key, name, result.model_dump_json())
+            await self._redis.expire(self._key, CHECKPOINT_TTL_SECONDS)
+        return result
+
+    async def close(self):
+        close = getattr(self._agent, "close", None)
+        if close is not None:
+            await close()
+
+
+def checkpoint_search_agents(service, redis, key: str) -> None:
+    """Wrap an agentic service's search agents; the original service has no per-source split."""
+    planner = getattr(service, "planning_agent", None)
+    if planner is None:
+        return
+    planner.search_agents = [CheckpointedSearchAgent(a, redis, key) for a in planner.search_agents]
+
+
+class NotifyOnceSMS:
+    """Wraps the SMS/email adapter; skips the send if an earlier attempt of this task delivered it."""
+
+    def __init__(self, sms, redis, key: str):
+        self._sms = sms
+        self._redis = redis  # redis.asyncio.Redis
+        self._key = key
+
+    async def send_sms(
+        self,
+        to_number: str,
+        message: str,
+        events: Optional[List] = None,
+        promo_text: Optional[str] = None,
+        scratchpad_text: Optional[str] = None
+    ) -> None:
+        if await self._redis.hget(self._key, NOTIFIED_FIELD) is not None:
+            print(f"♻️  Message to {to_number} already sent by an earlier attempt; skipping")
+            return
+
+        await self._sms.send_sms(
+            to_number, message, events=events, promo_text=promo_text, scratchpad_text=scratchpad_text
+        )
+        await self._redis.hset(self._key, NOTIFIED_FIELD, "1")
+        await self._redis.expire(self._key, CHECKPOINT_TTL_SECONDS)
+
+    async def close(self):
+        close = getattr(self._sms, "close", None)
+        if close is not None:
+            await close()
+
+
+def notify_once(service, redis, key: str) -> None:
+    """Make the service's email/SMS send at most once per successful delivery across retries."""
+    service.sms = NotifyOnceSMS(service.sms, redis, key)
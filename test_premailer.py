@@ -1,4 +1,7 @@
-from premailer import transform
+from premailer import Premailer
+
+# Same reusable inliner setup as EmailSMSAdapter's runtime fallback
+_PREMAILER = Premailer(cache_css_parsing=True)
 
 html = """
 <html>
@@ -17,6 +20,6 @@ print("BEFORE PREMAILER:")
 print(html)
 print("\n" + "="*80 + "\n")
 
-result = transform(html)
+result = _PREMAILER.transform(html, pretty_print=False)
 print("AFTER PREMAILER:")
 print(result)
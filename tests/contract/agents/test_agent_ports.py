@@ -2,6 +2,7 @@
 Contract tests for agent ports.
 Ensures all implementations conform to port behavior.
 """
+import asyncio
 import pytest
 from abc import ABC
 
@@ -19,40 +20,34 @@ from app.adapters.agents import (
     RelevanceScoreAgent,
     DateVerificationAgent,
 )
+from app.config.settings import get_settings
+from app.core.domain.models import Event
+from app.core.domain.agent_models import ReviewAgentResult
+
+SEARCH_AGENT_CLASSES = [EventbriteSearchAgent, TicketmasterSearchAgent, MeetupSearchAgent]
+REVIEW_AGENT_CLASSES = [URLValidatorAgent, RelevanceScoreAgent, DateVerificationAgent]
 
 
 @pytest.mark.contract
 class TestSearchAgentPort:
     """Contract tests for SearchAgentPort implementations."""
     
-    @pytest.mark.parametrize("agent_class", [
-        EventbriteSearchAgent,
-        TicketmasterSearchAgent,
-        MeetupSearchAgent,
-    ])
+    @pytest.mark.parametrize("agent_class", SEARCH_AGENT_CLASSES)
     def test_search_agent_implements_port(self, agent_class):
         """All search agents implement SearchAgentPort."""
         assert issubclass(agent_class, SearchAgentPort)
     
-    @pytest.mark.parametrize("agent_class", [
-        EventbriteSearchAgent,
-        TicketmasterSearchAgent,
-        MeetupSearchAgent,
-    ])
+    @pytest.mark.parametrize("agent_class", SEARCH_AGENT_CLASSES)
     def test_search_agent_has_required_methods(self, agent_class):
         """All search agents have required methods."""
         assert hasattr(agent_class, 'search_events')
         assert hasattr(agent_class, 'get_agent_name')
     
-    @pytest.mark.parametrize("agent_class", [
-        EventbriteSearchAgent,
-        TicketmasterSearchAgent,
-        MeetupSearchAgent,
-    ])
+    @pytest.mark.parametrize("agent_class", SEARCH_AGENT_CLASSES)
     def test_search_agent_get_name_returns_string(self, agent_class):
         """get_agent_name returns a string."""
-        from app.config.settings import Settings
-        agent = agent_class(Settings())
+        # Cached settings: env/.env is parsed once for the whole matrix
+        agent = agent_class(get_settings())
         name = agent.get_agent_name()
         assert isinstance(name, str)
         assert len(name) > 0
@@ -62,43 +57,29 @@ class TestSearchAgentPort:
 class TestReviewAgentPort:
     """Contract tests for ReviewAgentPort implementations."""
     
-    @pytest.mark.parametrize("agent_class", [
-        URLValidatorAgent,
-        RelevanceScoreAgent,
-        DateVerificationAgent,
-    ])
+    @pytest.mark.parametrize("agent_class", REVIEW_AGENT_CLASSES)
     def test_review_agent_implements_port(self, agent_class):
         """All review agents implement ReviewAgentPort."""
         assert issubclass(agent_class, ReviewAgentPort)
     
-    @pytest.mark.parametrize("agent_class", [
-        URLValidatorAgent,
-        RelevanceScoreAgent,
-        DateVerificationAgent,
-    ])
+    @pytest.mark.parametrize("agent_class", REVIEW_AGENT_CLASSES)
     def test_review_agent_has_required_methods(self, agent_class):
         """All review agents have required methods."""
         assert hasattr(agent_class, 'review_event')
     
     @pytest.mark.asyncio
-    @pytest.mark.parametrize("agent_class", [
-        URLValidatorAgent,
-        RelevanceScoreAgent,
-        DateVerificationAgent,
-    ])
-    async def test_review_agent_returns_correct_type(self, agent_class):
+    async def test_review_agent_returns_correct_type(self):
         """review_event returns ReviewAgentResult."""
-        from app.core.domain.models import Event
-        from app.core.domain.agent_models import ReviewAgentResult
-        
-        agent = agent_class()
+        agents = [cls() for cls in REVIEW_AGENT_CLASSES]
         event = Event(title="Test", source="Test")
-        result = await agent.review_event(event)
+        # Review concurrently so network-bound agents don't serialize the suite
+        results = await asyncio.gather(*(agent.review_event(event) for agent in agents))
         
-        assert isinstance(result, ReviewAgentResult)
-        assert hasattr(result, 'agent_id')
-        assert hasattr(result, 'enriched_event')
-        assert hasattr(result, 'success')
+        for agent, result in zip(agents, results):
+            assert isinstance(result, ReviewAgentResult), type(agent).__name__
+            assert hasattr(result, 'agent_id')
+            assert hasattr(result, 'enriched_event')
+            assert hasattr(result, 'success')
 
 
 @pytest.mark.contract
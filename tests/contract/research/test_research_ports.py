@@ -6,6 +6,7 @@ Any adapter implementing these ports should pass these contract tests.
 """
 import pytest
 from datetime import datetime
+from itertools import chain, islice
 from app.core.ports.research_port import (
     EntityExtractionPort,
     QueryGenerationPort,
@@ -33,7 +34,8 @@ class FakeEntityExtractor(EntityExtractionPort):
         entities = []
         
         # Simple keyword-based entity extraction
-        if "concert" in event.title.lower() or "music" in event.title.lower():
+        title_lower = event.title.lower()
+        if "concert" in title_lower or "music" in title_lower:
             entities.append(Entity(
                 name="Mock Artist",
                 type="artist",
@@ -105,7 +107,7 @@ class FakeKnowledgeSynthesizer(KnowledgeSynthesisPort):
         research_results: list[ResearchResult]
     ) -> EventResearch:
         """Synthesize mock research."""
-        all_facts = [fact for result in research_results for fact in result.facts]
+        all_facts = list(chain.from_iterable(result.facts for result in research_results))
         
         return EventResearch(
             event_title=event.title,
@@ -113,12 +115,79 @@ class FakeKnowledgeSynthesizer(KnowledgeSynthesisPort):
             queries=[],  # Simplified
             results=research_results,
             synthesized_narrative=f"This is a synthesized narrative about {event.title}. " + 
-                                 " ".join(all_facts[:3]),
+                                 " ".join(islice(all_facts, 3)),
             key_insights=all_facts[:5],
             overall_confidence=0.88
         )
 
 
+# ============================================================
+# SAMPLE DATA (models are frozen, so instances are safely shared)
+# ============================================================
+
+_HOT_MULLIGAN = Event(
+    title="Hot Mulligan Concert",
+    description="Emo/pop-punk band from Michigan",
+    start_time=datetime(2025, 11, 16, 19, 0),
+    location="House of Blues Houston",
+    categories=["music"]
+)
+
+_JAZZ_CONCERT = Event(
+    title="Jazz Concert",
+    description="Wynton Marsalis performs",
+    start_time=datetime(2025, 11, 16, 19, 0),
+    location="Hobby Center"
+)
+
+_WYNTON_CONCERT = Event(
+    title="Wynton Marsalis Jazz Concert",
+    description="Jazz at Lincoln Center Orchestra",
+    start_time=datetime(2025, 11, 16, 19, 0),
+    location="Hobby Center"
+)
+
+_WYNTON_ENTITIES = (
+    Entity(name="Wynton Marsalis", type="artist", confidence=0.95),
+    Entity(name="Hobby Center", type="venue", confidence=0.90),
+)
+
+
+_HOT_MULLIGAN_QUERY = ResearchQuery(
+    query="What are the biggest hits of Hot Mulligan?",
+    priority=10,
+    entity_name="Hot Mulligan",
+    query_type="biographical"
+)
+
+_WYNTON_RESULTS = (
+    ResearchResult(
+        query=ResearchQuery(
+            query="What are Wynton Marsalis's achievements?",
+            priority=10,
+            entity_name="Wynton Marsalis",
+            query_type="awards"
+        ),
+        agent_id="web_search",
+        facts=["Won 9 Grammy Awards", "Pulitzer Prize winner"],
+        confidence=0.90,
+        sources=["https://example.com/wynton"]
+    ),
+    ResearchResult(
+        query=ResearchQuery(
+            query="What is Hobby Center's history?",
+            priority=8,
+            entity_name="Hobby Center",
+            query_type="venue_history"
+        ),
+        agent_id="web_search",
+        facts=["Opened in 2002", "Premier Houston venue"],
+        confidence=0.85,
+        sources=["https://example.com/hobby-center"]
+    ),
+)
+
+
 # ============================================================
 # CONTRACT TESTS
 # ============================================================
@@ -132,38 +201,27 @@ class TestEntityExtractionPortContract:
         """Provide a fake entity extractor."""
         return FakeEntityExtractor()
     
-    @pytest.fixture
-    def sample_event(self):
-        """Provide a sample event."""
-        return Event(
-            title="Hot Mulligan Concert",
-            description="Emo/pop-punk band from Michigan",
-            start_time=datetime(2025, 11, 16, 19, 0),
-            location="House of Blues Houston",
-            categories=["music"]
-        )
-    
     @pytest.mark.asyncio
-    async def test_extract_entities_returns_list(self, entity_extractor, sample_event):
+    async def test_extract_entities_returns_list(self, entity_extractor):
         """extract_entities should return a list of Entity objects."""
-        entities = await entity_extractor.extract_entities(sample_event)
+        entities = await entity_extractor.extract_entities(_HOT_MULLIGAN)
         
         assert isinstance(entities, list)
         assert all(isinstance(e, Entity) for e in entities)
     
     @pytest.mark.asyncio
-    async def test_extract_entities_includes_confidence(self, entity_extractor, sample_event):
+    async def test_extract_entities_includes_confidence(self, entity_extractor):
         """All extracted entities should have confidence scores."""
-        entities = await entity_extractor.extract_entities(sample_event)
+        entities = await entity_extractor.extract_entities(_HOT_MULLIGAN)
         
         for entity in entities:
             assert 0.0 <= entity.confidence <= 1.0
     
     @pytest.mark.asyncio
-    async def test_extract_entities_valid_types(self, entity_extractor, sample_event):
+    async def test_extract_entities_valid_types(self, entity_extractor):
         """All extracted entities should have valid types."""
         valid_types = ["artist", "venue", "organizer", "topic", "genre"]
-        entities = await entity_extractor.extract_entities(sample_event)
+        entities = await entity_extractor.extract_entities(_HOT_MULLIGAN)
         
         for entity in entities:
             assert entity.type in valid_types
@@ -178,64 +236,31 @@ class TestQueryGenerationPortContract:
         """Provide a fake query generator."""
         return FakeQueryGenerator()
     
-    @pytest.fixture
-    def sample_event(self):
-        """Provide a sample event."""
-        return Event(
-            title="Jazz Concert",
-            description="Wynton Marsalis performs",
-            start_time=datetime(2025, 11, 16, 19, 0),
-            location="Hobby Center"
-        )
-    
-    @pytest.fixture
-    def sample_entities(self):
-        """Provide sample entities."""
-        return [
-            Entity(name="Wynton Marsalis", type="artist", confidence=0.95),
-            Entity(name="Hobby Center", type="venue", confidence=0.90)
-        ]
-    
     @pytest.mark.asyncio
-    async def test_generate_queries_returns_list(
-        self,
-        query_generator,
-        sample_event,
-        sample_entities
-    ):
+    async def test_generate_queries_returns_list(self, query_generator):
         """generate_queries should return a list of ResearchQuery objects."""
-        queries = await query_generator.generate_queries(sample_event, sample_entities)
+        queries = await query_generator.generate_queries(_JAZZ_CONCERT, list(_WYNTON_ENTITIES))
         
         assert isinstance(queries, list)
         assert all(isinstance(q, ResearchQuery) for q in queries)
     
     @pytest.mark.asyncio
-    async def test_generate_queries_valid_priorities(
-        self,
-        query_generator,
-        sample_event,
-        sample_entities
-    ):
+    async def test_generate_queries_valid_priorities(self, query_generator):
         """All queries should have valid priority (1-10)."""
-        queries = await query_generator.generate_queries(sample_event, sample_entities)
+        queries = await query_generator.generate_queries(_JAZZ_CONCERT, list(_WYNTON_ENTITIES))
         
         for query in queries:
             assert 1 <= query.priority <= 10
     
     @pytest.mark.asyncio
-    async def test_generate_queries_valid_types(
-        self,
-        query_generator,
-        sample_event,
-        sample_entities
-    ):
+    async def test_generate_queries_valid_types(self, query_generator):
         """All queries should have valid query types."""
         valid_types = [
             "biographical", "contextual", "current", "relational",
             "cultural_impact", "venue_history", "genre_overview",
             "collaboration", "historical", "awards"
         ]
-        queries = await query_generator.generate_queries(sample_event, sample_entities)
+        queries = await query_generator.generate_queries(_JAZZ_CONCERT, list(_WYNTON_ENTITIES))
         
         for query in queries:
             assert query.query_type in valid_types
@@ -250,43 +275,33 @@ class TestResearchAgentPortContract:
         """Provide a fake research agent."""
         return FakeResearchAgent()
     
-    @pytest.fixture
-    def sample_query(self):
-        """Provide a sample research query."""
-        return ResearchQuery(
-            query="What are the biggest hits of Hot Mulligan?",
-            priority=10,
-            entity_name="Hot Mulligan",
-            query_type="biographical"
-        )
-    
     @pytest.mark.asyncio
-    async def test_research_returns_result(self, research_agent, sample_query):
+    async def test_research_returns_result(self, research_agent):
         """research should return a ResearchResult."""
-        result = await research_agent.research(sample_query)
+        result = await research_agent.research(_HOT_MULLIGAN_QUERY)
         
         assert isinstance(result, ResearchResult)
-        assert result.query.query == sample_query.query
+        assert result.query.query == _HOT_MULLIGAN_QUERY.query
     
     @pytest.mark.asyncio
-    async def test_research_includes_facts(self, research_agent, sample_query):
+    async def test_research_includes_facts(self, research_agent):
         """research result should include facts list."""
-        result = await research_agent.research(sample_query)
+        result = await research_agent.research(_HOT_MULLIGAN_QUERY)
         
         assert isinstance(result.facts, list)
         assert all(isinstance(fact, str) for fact in result.facts)
     
     @pytest.mark.asyncio
-    async def test_research_includes_confidence(self, research_agent, sample_query):
+    async def test_research_includes_confidence(self, research_agent):
         """research result should include confidence score."""
-        result = await research_agent.research(sample_query)
+        result = await research_agent.research(_HOT_MULLIGAN_QUERY)
         
         assert 0.0 <= result.confidence <= 1.0
     
     @pytest.mark.asyncio
-    async def test_research_includes_agent_id(self, research_agent, sample_query):
+    async def test_research_includes_agent_id(self, research_agent):
         """research result should include agent_id."""
-        result = await research_agent.research(sample_query)
+        result = await research_agent.research(_HOT_MULLIGAN_QUERY)
         
         assert result.agent_id == research_agent.get_agent_id()
     
@@ -307,123 +322,49 @@ class TestKnowledgeSynthesisPortContract:
         """Provide a fake knowledge synthesizer."""
         return FakeKnowledgeSynthesizer()
     
-    @pytest.fixture
-    def sample_event(self):
-        """Provide a sample event."""
-        return Event(
-            title="Wynton Marsalis Jazz Concert",
-            description="Jazz at Lincoln Center Orchestra",
-            start_time=datetime(2025, 11, 16, 19, 0),
-            location="Hobby Center"
-        )
-    
-    @pytest.fixture
-    def sample_entities(self):
-        """Provide sample entities."""
-        return [
-            Entity(name="Wynton Marsalis", type="artist", confidence=0.95),
-            Entity(name="Hobby Center", type="venue", confidence=0.90)
-        ]
-    
-    @pytest.fixture
-    def sample_results(self):
-        """Provide sample research results."""
-        query1 = ResearchQuery(
-            query="What are Wynton Marsalis's achievements?",
-            priority=10,
-            entity_name="Wynton Marsalis",
-            query_type="awards"
-        )
-        query2 = ResearchQuery(
-            query="What is Hobby Center's history?",
-            priority=8,
-            entity_name="Hobby Center",
-            query_type="venue_history"
-        )
-        return [
-            ResearchResult(
-                query=query1,
-                agent_id="web_search",
-                facts=["Won 9 Grammy Awards", "Pulitzer Prize winner"],
-                confidence=0.90,
-                sources=["https://example.com/wynton"]
-            ),
-            ResearchResult(
-                query=query2,
-                agent_id="web_search",
-                facts=["Opened in 2002", "Premier Houston venue"],
-                confidence=0.85,
-                sources=["https://example.com/hobby-center"]
-            )
-        ]
-    
     @pytest.mark.asyncio
-    async def test_synthesize_returns_event_research(
-        self,
-        synthesizer,
-        sample_event,
-        sample_entities,
-        sample_results
-    ):
+    async def test_synthesize_returns_event_research(self, synthesizer):
         """synthesize should return EventResearch object."""
         research = await synthesizer.synthesize(
-            sample_event,
-            sample_entities,
-            sample_results
+            _WYNTON_CONCERT,
+            list(_WYNTON_ENTITIES),
+            list(_WYNTON_RESULTS)
         )
         
         assert isinstance(research, EventResearch)
-        assert research.event_title == sample_event.title
+        assert research.event_title == _WYNTON_CONCERT.title
     
     @pytest.mark.asyncio
-    async def test_synthesize_includes_narrative(
-        self,
-        synthesizer,
-        sample_event,
-        sample_entities,
-        sample_results
-    ):
+    async def test_synthesize_includes_narrative(self, synthesizer):
         """synthesize should produce a narrative string."""
         research = await synthesizer.synthesize(
-            sample_event,
-            sample_entities,
-            sample_results
+            _WYNTON_CONCERT,
+            list(_WYNTON_ENTITIES),
+            list(_WYNTON_RESULTS)
         )
         
         assert isinstance(research.synthesized_narrative, str)
         assert len(research.synthesized_narrative) > 0
     
     @pytest.mark.asyncio
-    async def test_synthesize_includes_insights(
-        self,
-        synthesizer,
-        sample_event,
-        sample_entities,
-        sample_results
-    ):
+    async def test_synthesize_includes_insights(self, synthesizer):
         """synthesize should extract key insights."""
         research = await synthesizer.synthesize(
-            sample_event,
-            sample_entities,
-            sample_results
+            _WYNTON_CONCERT,
+            list(_WYNTON_ENTITIES),
+            list(_WYNTON_RESULTS)
         )
         
         assert isinstance(research.key_insights, list)
         assert all(isinstance(insight, str) for insight in research.key_insights)
     
     @pytest.mark.asyncio
-    async def test_synthesize_includes_confidence(
-        self,
-        synthesizer,
-        sample_event,
-        sample_entities,
-        sample_results
-    ):
+    async def test_synthesize_includes_confidence(self, synthesizer):
         """synthesize should include overall confidence score."""
         research = await synthesizer.synthesize(
-            sample_event,
-            sample_entities,
-            sample_results
+            _WYNTON_CONCERT,
+            list(_WYNTON_ENTITIES),
+            list(_WYNTON_RESULTS)
         )
         
         assert 0.0 <= research.overall_confidence <= 1.0
@@ -5,6 +5,7 @@ Tests the full end-to-end agent orchestration.
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+from app.config.settings import Settings
 from app.core.domain.agent_models import PlanningState, AgentPhase, EnrichedEvent
 from app.core.domain.models import Event
 from app.adapters.agents import (
@@ -107,8 +108,6 @@ class TestSearchAgentExecution:
     @pytest.mark.slow
     async def test_search_agent_handles_missing_api_key(self):
         """Search agents gracefully handle missing API keys."""
-        from app.config.settings import Settings
-        
         # Create settings with no API keys
         settings = Settings()
         settings.eventbrite_api_key = None
@@ -0,0 +1,33 @@
+"""
+Shared fixtures for the deep research integration tests.
+
+Each research agent module's pydantic-ai ``Agent`` is patched per test; tests set
+``return_value`` on the yielded class mock to script the LLM reply.
+"""
+import pytest
+from unittest.mock import patch
+
+
+@pytest.fixture
+def patched_entity_agent():
+    """Agent class used by EntityExtractionAgent."""
+    # Imported here so the agent stack only loads when a test needs it
+    from app.adapters.agents.research import entity_extraction_agent
+    with patch.object(entity_extraction_agent, "Agent") as agent_class:
+        yield agent_class
+
+
+@pytest.fixture
+def patched_query_agent():
+    """Agent class used by QueryGenerationAgent."""
+    from app.adapters.agents.research import query_generation_agent
+    with patch.object(query_generation_agent, "Agent") as agent_class:
+        yield agent_class
+
+
+@pytest.fixture
+def patched_synthesis_agent():
+    """Agent class used by KnowledgeSynthesisAgent."""
+    from app.adapters.agents.research import knowledge_synthesis_agent
+    with patch.object(knowledge_synthesis_agent, "Agent") as agent_class:
+        yield agent_class
@@ -3,23 +3,114 @@ Integration tests for deep research workflow.
 
 Tests the full deep research pipeline with mocked external API calls.
 """
+import httpx
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 from app.core.domain.models import Event
 from app.core.domain.research_models import (
+    ALL_QUERY_TYPES,
     Entity,
     ResearchQuery,
     ResearchResult,
     EventResearch
 )
-from app.adapters.agents.research.entity_extraction_agent import EntityExtractionAgent
-from app.adapters.agents.research.query_generation_agent import QueryGenerationAgent
-from app.adapters.agents.research.web_search_research_agent import WebSearchResearchAgent
-from app.adapters.agents.research.knowledge_synthesis_agent import KnowledgeSynthesisAgent
 
+# Agent modules (pydantic-ai, openai) are imported inside the tests, so collecting
+# this file for a marker-filtered run doesn't load the whole agent stack
 
-@pytest.fixture
+# One event loop for the whole module instead of a fresh loop per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Shared SerpAPI reply for the web search tests (never mutated)
+_SERPAPI_RESPONSE = {
+    "organic_results": [
+        {
+            "title": "Hot Mulligan - Top Songs",
+            "snippet": "Hot Mulligan's biggest hits include 'Equip Sunglasses' and 'BCKYRD'",
+            "link": "https://example.com/hot-mulligan"
+        },
+        {
+            "title": "Hot Mulligan Albums",
+            "snippet": "you'll be fine is their most successful album",
+            "link": "https://example.com/albums"
+        }
+    ]
+}
+
+
+_MUSIC_KEYWORDS = ("hit", "album", "song", "tour")
+
+
+def _async_return(value):
+    """Stand-in for Agent.run: an async function returning ``value`` (no call tracking)."""
+    async def _run(*args, **kwargs):
+        return value
+    return _run
+
+
+def _scripted_agent(data):
+    """Agent instance whose run() replies with ``data``."""
+    agent = Mock(spec=['run'])
+    agent.run = _async_return(SimpleNamespace(data=data))
+    return agent
+
+
+# Known-valid literals, so built once without validation; context as the extractor records it
+_SAMPLE_ENTITIES = (
+    Entity.model_construct(
+        name="Hot Mulligan", type="artist", confidence=0.95,
+        metadata={"context": "Michigan emo/pop-punk band headlining the show"}
+    ),
+    Entity.model_construct(
+        name="House of Blues Houston", type="venue", confidence=0.90,
+        metadata={"context": "Downtown Houston music venue hosting the tour stop"}
+    ),
+)
+
+
+# Research facts fed to the synthesizer
+_HIT_FACTS = (
+    "Hot Mulligan's biggest hit is 'Equip Sunglasses'",
+    "Their album 'you'll be fine' was critically acclaimed",
+    "They've toured with bands like Mom Jeans and Prince Daddy",
+)
+
+_VENUE_FACTS = (
+    "House of Blues opened in 1992",
+    "An iconic stop for major rock and alternative acts",
+    "Capacity of 1,000+ in Houston location",
+)
+
+
+# Scripted LLM replies for the end-to-end workflow (entity -> query -> synthesis).
+# All raw model text: each agent parses its own reply format out of result.data.
+_ENTITY_PAYLOAD = """ENTITY: Hot Mulligan | TYPE: artist | CONTEXT: Emo band headlining the tour
+ENTITY: House of Blues | TYPE: venue | CONTEXT: Houston venue hosting the show"""
+
+_QUERY_PAYLOAD = '''{
+    "queries": [
+        {
+            "query": "What are Hot Mulligan's biggest hits and albums?",
+            "priority": 10,
+            "entity_name": "Hot Mulligan",
+            "query_type": "biographical"
+        },
+        {
+            "query": "What is the capacity and history of House of Blues Houston?",
+            "priority": 8,
+            "entity_name": "House of Blues",
+            "query_type": "venue_history"
+        }
+    ]
+}'''
+
+_SYNTHESIS_PAYLOAD = "Hot Mulligan brings their emo energy to House of Blues!"
+
+
+# Event is frozen, so one instance per session is safe to share across tests
+@pytest.fixture(scope="session")
 def sample_music_event():
     """Sample music event for testing."""
     return Event(
@@ -33,7 +124,7 @@ def sample_music_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_comedy_event():
     """Sample comedy event for testing."""
     return Event(
@@ -47,6 +138,35 @@ def sample_comedy_event():
     )
 
 
+class _StubSerpAPIClient:
+    """Stands in for the shared httpx client; every GET gets the same prebuilt reply."""
+    _reply = httpx.Response(200, json=_SERPAPI_RESPONSE)
+
+    async def get(self, url, params=None, **kwargs):
+        return self._reply
+
+
+@pytest.fixture(scope="module")
+def serpapi_client():
+    """Client stub answering every SerpAPI request with _SERPAPI_RESPONSE."""
+    return _StubSerpAPIClient()
+
+
+@pytest.fixture
+def workflow_mocks(patched_entity_agent, patched_query_agent, patched_synthesis_agent, serpapi_client):
+    """Script every step of the end-to-end workflow from the precomputed payloads."""
+    handles = SimpleNamespace(
+        entity=_scripted_agent(_ENTITY_PAYLOAD),
+        query=_scripted_agent(_QUERY_PAYLOAD),
+        synthesis=_scripted_agent(_SYNTHESIS_PAYLOAD),
+        serpapi_client=serpapi_client,
+    )
+    patched_entity_agent.return_value = handles.entity
+    patched_query_agent.return_value = handles.query
+    patched_synthesis_agent.return_value = handles.synthesis
+    return handles
+
+
 @pytest.fixture
 def mock_openai_api_key():
     """Mock OpenAI API key for testing."""
@@ -57,39 +177,20 @@ def mock_openai_api_key():
 class TestEntityExtractionIntegration:
     """Test entity extraction with mocked LLM."""
     
-    @pytest.mark.asyncio
-    @patch('app.adapters.agents.research.entity_extraction_agent.Agent')
     async def test_extract_entities_from_music_event(
         self,
-        mock_agent_class,
+        patched_entity_agent,
         sample_music_event,
         mock_openai_api_key
     ):
         """Entity extractor should identify key entities in a music event."""
+        from app.adapters.agents.research.entity_extraction_agent import EntityExtractionAgent
         # Mock the agent response
-        mock_agent_instance = MagicMock()
-        mock_result = MagicMock()
-        mock_result.data = {
-            "entities": [
-                {
-                    "name": "Hot Mulligan",
-                    "type": "artist",
-                    "confidence": 0.95
-                },
-                {
-                    "name": "House of Blues Houston",
-                    "type": "venue",
-                    "confidence": 0.90
-                },
-                {
-                    "name": "Emo",
-                    "type": "topic",
-                    "confidence": 0.85
-                }
-            ]
-        }
-        mock_agent_instance.run = AsyncMock(return_value=mock_result)
-        mock_agent_class.return_value = mock_agent_instance
+        patched_entity_agent.return_value = _scripted_agent(
+            "ENTITY: Hot Mulligan | TYPE: artist | CONTEXT: Band headlining the tour\n"
+            "ENTITY: House of Blues Houston | TYPE: venue | CONTEXT: Venue hosting the show\n"
+            "ENTITY: Emo | TYPE: genre | CONTEXT: The band's genre"
+        )
         
         # Run extraction
         extractor = EntityExtractionAgent(mock_openai_api_key)
@@ -106,42 +207,18 @@ class TestEntityExtractionIntegration:
 class TestQueryGenerationIntegration:
     """Test query generation with mocked LLM."""
     
-    @pytest.mark.asyncio
-    @patch('app.adapters.agents.research.query_generation_agent.Agent')
     async def test_generate_queries_for_music_event(
         self,
-        mock_agent_class,
+        patched_query_agent,
         sample_music_event,
         mock_openai_api_key
     ):
         """Query generator should create music-focused queries for music events."""
-        # Mock entities
-        entities = [
-            Entity(name="Hot Mulligan", type="artist", confidence=0.95),
-            Entity(name="House of Blues Houston", type="venue", confidence=0.90)
-        ]
+        from app.adapters.agents.research.query_generation_agent import QueryGenerationAgent
+        entities = list(_SAMPLE_ENTITIES)
         
         # Mock the agent response
-        mock_agent_instance = MagicMock()
-        mock_result = MagicMock()
-        mock_result.data = '''{
-            "queries": [
-                {
-                    "query": "What are Hot Mulligan's biggest hit songs and albums?",
-                    "priority": 10,
-                    "entity_name": "Hot Mulligan",
-                    "query_type": "biographical"
-                },
-                {
-                    "query": "What is the history of House of Blues Houston?",
-                    "priority": 8,
-                    "entity_name": "House of Blues Houston",
-                    "query_type": "venue_history"
-                }
-            ]
-        }'''
-        mock_agent_instance.run = AsyncMock(return_value=mock_result)
-        mock_agent_class.return_value = mock_agent_instance
+        patched_query_agent.return_value = _scripted_agent(_QUERY_PAYLOAD)
         
         # Run query generation
         generator = QueryGenerationAgent(mock_openai_api_key)
@@ -151,136 +228,81 @@ class TestQueryGenerationIntegration:
         assert len(queries) >= 1
         assert len(queries) <= 3  # Should respect rate limit (2-3 queries)
         
-        # Check that at least one query is music-related
-        music_related = any(
-            any(keyword in q.query.lower() for keyword in ['hit', 'album', 'song', 'tour'])
-            for q in queries
-        )
-        assert music_related, "Should have at least one music-related query"
-        
-        # Verify query structure
+        # Verify query structure and that at least one query is music-related, in one pass
+        music_related = False
         for query in queries:
             assert 1 <= query.priority <= 10
-            assert query.query_type in [
-                "biographical", "contextual", "current", "relational",
-                "cultural_impact", "venue_history", "genre_overview",
-                "collaboration", "historical", "awards"
-            ]
+            assert query.query_type in ALL_QUERY_TYPES
+            music_related |= any(keyword in query.query.lower() for keyword in _MUSIC_KEYWORDS)
+        assert music_related, "Should have at least one music-related query"
 
 
 @pytest.mark.integration
 class TestWebSearchResearchIntegration:
     """Test web search research with mocked SerpAPI."""
     
-    @pytest.mark.asyncio
-    async def test_research_with_mocked_serpapi(self, mock_openai_api_key):
+    async def test_research_with_mocked_serpapi(self, serpapi_client, mock_openai_api_key):
         """Web search agent should handle mocked SerpAPI responses."""
-        query = ResearchQuery(
+        from app.adapters.agents.research.web_search_research_agent import WebSearchResearchAgent
+        query = ResearchQuery.model_construct(
             query="What are Hot Mulligan's biggest hits?",
             priority=10,
             entity_name="Hot Mulligan",
             query_type="biographical"
         )
         
-        # Mock SerpAPI response
-        mock_serpapi_response = {
-            "organic_results": [
-                {
-                    "title": "Hot Mulligan - Top Songs",
-                    "snippet": "Hot Mulligan's biggest hits include 'Equip Sunglasses' and 'BCKYRD'",
-                    "link": "https://example.com/hot-mulligan"
-                },
-                {
-                    "title": "Hot Mulligan Albums",
-                    "snippet": "you'll be fine is their most successful album",
-                    "link": "https://example.com/albums"
-                }
-            ]
-        }
+        # Run research
+        agent = WebSearchResearchAgent(serpapi_key="mock-key")
+        agent.client = serpapi_client
+        result = await agent.research(query)
         
-        with patch('requests.get') as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = mock_serpapi_response
-            mock_get.return_value = mock_response
-            
-            # Run research
-            agent = WebSearchResearchAgent(serpapi_key="mock-key")
-            result = await agent.research(query)
-            
-            # Verify results
-            assert isinstance(result, ResearchResult)
-            assert result.query == query.query
-            assert result.agent_id == "web_search"
-            assert len(result.facts) > 0
-            assert result.confidence > 0.0
+        # Verify results
+        assert isinstance(result, ResearchResult)
+        assert result.query == query
+        assert result.agent_id == "web_search"
+        assert len(result.facts) > 0
+        assert result.confidence > 0.0
 
 
 @pytest.mark.integration
 class TestKnowledgeSynthesisIntegration:
     """Test knowledge synthesis with mocked LLM."""
     
-    @pytest.mark.asyncio
-    @patch('app.adapters.agents.research.knowledge_synthesis_agent.Agent')
     async def test_synthesize_research_into_narrative(
         self,
-        mock_agent_class,
+        patched_synthesis_agent,
         sample_music_event,
         mock_openai_api_key
     ):
         """Synthesizer should combine research into coherent narrative."""
-        # Mock entities
-        entities = [
-            Entity(name="Hot Mulligan", type="artist", confidence=0.95),
-            Entity(name="House of Blues", type="venue", confidence=0.90)
-        ]
+        from app.adapters.agents.research.knowledge_synthesis_agent import KnowledgeSynthesisAgent
+        entities = list(_SAMPLE_ENTITIES)
         
         # Mock research results
         results = [
             ResearchResult(
-                query="What are Hot Mulligan's hits?",
+                query=ResearchQuery(query="What are Hot Mulligan's hits?", priority=10),
                 agent_id="web_search",
-                facts=[
-                    "Hot Mulligan's biggest hit is 'Equip Sunglasses'",
-                    "Their album 'you'll be fine' was critically acclaimed",
-                    "They've toured with bands like Mom Jeans and Prince Daddy"
-                ],
+                facts=list(_HIT_FACTS),
                 confidence=0.90,
                 sources=["https://example.com/1"]
             ),
             ResearchResult(
-                query="What is House of Blues history?",
+                query=ResearchQuery(query="What is House of Blues history?", priority=8),
                 agent_id="web_search",
-                facts=[
-                    "House of Blues opened in 1992",
-                    "Known for hosting major rock and alternative acts",
-                    "Capacity of 1,000+ in Houston location"
-                ],
+                facts=list(_VENUE_FACTS),
                 confidence=0.85,
                 sources=["https://example.com/2"]
             )
         ]
         
         # Mock the agent response
-        mock_agent_instance = MagicMock()
-        mock_result = MagicMock()
-        mock_result.data = {
-            "narrative": (
-                "Hot Mulligan, the acclaimed emo/pop-punk band known for hits like "
-                "'Equip Sunglasses' and their critically acclaimed album 'you'll be fine', "
-                "brings their energetic live show to Houston's iconic House of Blues, "
-                "a venue that has hosted major rock acts since 1992."
-            ),
-            "key_insights": [
-                "'Equip Sunglasses' is their biggest hit song",
-                "They've toured with Mom Jeans and Prince Daddy",
-                "House of Blues opened in 1992",
-                "The venue is known for major rock acts",
-                "'you'll be fine' was critically acclaimed"
-            ]
-        }
-        mock_agent_instance.run = AsyncMock(return_value=mock_result)
-        mock_agent_class.return_value = mock_agent_instance
+        patched_synthesis_agent.return_value = _scripted_agent(
+            "Hot Mulligan, the acclaimed emo/pop-punk band known for hits like "
+            "'Equip Sunglasses' and their critically acclaimed album 'you'll be fine', "
+            "brings their energetic live show to Houston's iconic House of Blues, "
+            "a venue that has hosted major rock acts since 1992."
+        )
         
         # Run synthesis
         synthesizer = KnowledgeSynthesisAgent(mock_openai_api_key)
@@ -291,9 +313,11 @@ class TestKnowledgeSynthesisIntegration:
         assert research.event_title == sample_music_event.title
         assert len(research.entities) == 2
         assert len(research.results) == 2
+        # Built from the LLM reply, not the fallback (which drops the queries)
+        assert research.queries == [r.query for r in results]
         assert len(research.synthesized_narrative) > 100
         assert len(research.key_insights) >= 3
-        assert 0.0 <= research.confidence <= 1.0
+        assert 0.0 <= research.overall_confidence <= 1.0
         
         # Verify narrative mentions key facts
         narrative_lower = research.synthesized_narrative.lower()
@@ -305,85 +329,19 @@ class TestKnowledgeSynthesisIntegration:
 class TestFullDeepResearchWorkflow:
     """Test the complete deep research workflow."""
     
-    @pytest.mark.asyncio
-    @patch('app.adapters.agents.research.entity_extraction_agent.Agent')
-    @patch('app.adapters.agents.research.query_generation_agent.Agent')
-    @patch('app.adapters.agents.research.knowledge_synthesis_agent.Agent')
     async def test_end_to_end_research_workflow(
         self,
-        mock_synthesis_agent,
-        mock_query_agent,
-        mock_entity_agent,
+        workflow_mocks,
         sample_music_event,
         mock_openai_api_key
     ):
         """Test full workflow from entity extraction to synthesis."""
-        
-        # ============================================================
-        # Step 1: Mock Entity Extraction
-        # ============================================================
-        mock_entity_instance = MagicMock()
-        mock_entity_result = MagicMock()
-        mock_entity_result.data = {
-            "entities": [
-                {"name": "Hot Mulligan", "type": "artist", "confidence": 0.95},
-                {"name": "House of Blues", "type": "venue", "confidence": 0.90}
-            ]
-        }
-        mock_entity_instance.run = AsyncMock(return_value=mock_entity_result)
-        mock_entity_agent.return_value = mock_entity_instance
-        
-        # ============================================================
-        # Step 2: Mock Query Generation
-        # ============================================================
-        mock_query_instance = MagicMock()
-        mock_query_result = MagicMock()
-        mock_query_result.data = '''{
-            "queries": [
-                {
-                    "query": "What are Hot Mulligan's biggest hits and albums?",
-                    "priority": 10,
-                    "entity_name": "Hot Mulligan",
-                    "query_type": "biographical"
-                },
-                {
-                    "query": "What is the capacity and history of House of Blues Houston?",
-                    "priority": 8,
-                    "entity_name": "House of Blues",
-                    "query_type": "venue_history"
-                }
-            ]
-        }'''
-        mock_query_instance.run = AsyncMock(return_value=mock_query_result)
-        mock_query_agent.return_value = mock_query_instance
-        
-        # ============================================================
-        # Step 3: Mock Research (SerpAPI)
-        # ============================================================
-        mock_serpapi_response = {
-            "organic_results": [
-                {
-                    "title": "Hot Mulligan Greatest Hits",
-                    "snippet": "Top songs: Equip Sunglasses, BCKYRD, Featuring Mark Hoppus",
-                    "link": "https://example.com/hits"
-                }
-            ]
-        }
-        
-        # ============================================================
-        # Step 4: Mock Knowledge Synthesis
-        # ============================================================
-        mock_synthesis_instance = MagicMock()
-        mock_synthesis_result = MagicMock()
-        mock_synthesis_result.data = {
-            "narrative": "Hot Mulligan brings their emo energy to House of Blues!",
-            "key_insights": [
-                "Known for 'Equip Sunglasses'",
-                "House of Blues is an iconic venue"
-            ]
-        }
-        mock_synthesis_instance.run = AsyncMock(return_value=mock_synthesis_result)
-        mock_synthesis_agent.return_value = mock_synthesis_instance
+        from app.adapters.agents.research import (
+            EntityExtractionAgent,
+            QueryGenerationAgent,
+            WebSearchResearchAgent,
+            KnowledgeSynthesisAgent,
+        )
         
         # ============================================================
         # Execute Full Workflow
@@ -400,19 +358,14 @@ class TestFullDeepResearchWorkflow:
         assert len(queries) == 2
         
         # 3. Research queries
-        with patch('requests.get') as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = mock_serpapi_response
-            mock_get.return_value = mock_response
-            
-            research_agent = WebSearchResearchAgent(serpapi_key="mock-key")
-            results = []
-            for query in queries:
-                result = await research_agent.research(query)
-                results.append(result)
-            
-            assert len(results) == 2
+        research_agent = WebSearchResearchAgent(serpapi_key="mock-key")
+        research_agent.client = workflow_mocks.serpapi_client
+        results = []
+        for query in queries:
+            result = await research_agent.research(query)
+            results.append(result)
+        
+        assert len(results) == 2
         
         # 4. Synthesize knowledge
         synthesizer = KnowledgeSynthesisAgent(mock_openai_api_key)
@@ -431,16 +384,5 @@ class TestFullDeepResearchWorkflow:
         assert len(final_research.results) == 2
         assert len(final_research.synthesized_narrative) > 0
         assert len(final_research.key_insights) >= 2
-        assert final_research.confidence > 0.0
-        
-        print("\n" + "="*60)
-        print("🎤 FULL DEEP RESEARCH WORKFLOW TEST COMPLETE! 🎤")
-        print("="*60)
-        print(f"Event: {final_research.event_title}")
-        print(f"Entities: {len(final_research.entities)}")
-        print(f"Queries Researched: {len(final_research.results)}")
-        print(f"Facts Gathered: {sum(len(r.facts) for r in final_research.results)}")
-        print(f"Key Insights: {len(final_research.key_insights)}")
-        print(f"Confidence: {final_research.confidence:.2f}")
-        print("="*60)
+        assert final_research.overall_confidence > 0.0
 
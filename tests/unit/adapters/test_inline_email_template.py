@@ -0,0 +1,46 @@
+"""
+Unit tests for the build-time email CSS inliner.
+
+The pre-inlined template must render exactly what runtime premailer produced.
+"""
+import logging
+import pytest
+from jinja2 import Environment, FileSystemLoader
+
+premailer = pytest.importorskip("premailer")
+
+from app.adapters.sms.inline_email_template import TEMPLATE_DIR, SOURCE_NAME, inline_template
+from app.core.domain.models import Event
+
+
+@pytest.mark.unit
+class TestInlineTemplate:
+    """Test Jinja-safe CSS inlining."""
+
+    def test_matches_runtime_premailer(self):
+        """Rendering the inlined template equals inlining the rendered template."""
+        env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)))
+        source = (TEMPLATE_DIR / SOURCE_NAME).read_text(encoding="utf-8")
+        context = dict(
+            promo_text="OHHH YEAHHH! Houston is ON FIRE this weekend!",
+            events=[Event(title="Sunday Bike Ride", url="https://example.com", categories=["cycling"])],
+            scratchpad_text="Picked the ride first.",
+        )
+
+        expected = premailer.transform(
+            env.get_template(SOURCE_NAME).render(**context),
+            cssutils_logging_level=logging.CRITICAL,
+        )
+        actual = env.from_string(inline_template(source)).render(**context)
+
+        assert actual == expected
+
+    def test_keeps_jinja_syntax(self):
+        """Jinja tags survive premailer untouched."""
+        src = '<style>p {color: red}</style><a href="{{ url }}">{% if n > 1 %}<p>x</p>{% endif %}</a>'
+
+        out = inline_template(src)
+
+        assert '{{ url }}' in out
+        assert '{% if n > 1 %}' in out
+        assert 'style="color:red"' in out
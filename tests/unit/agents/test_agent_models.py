@@ -18,6 +18,11 @@ from app.core.domain.agent_models import (
 )
 from app.core.domain.models import Event
 
+# Event is frozen, so the models under test can share these
+_MINIMAL_EVENT = Event(title="Test Event", source="Test")
+_BIKE_EVENT = Event(title="Bike Ride", source="Test")
+_EVENT_1 = Event(title="Event 1", source="Test")
+
 
 @pytest.mark.unit
 class TestAgentPhase:
@@ -125,13 +130,10 @@ class TestPlanningState:
     def test_get_latest_observations(self):
         """Can retrieve latest N observations."""
         state = PlanningState()
-        
-        for i in range(10):
-            state.add_observation(
-                agent="Agent",
-                thought=f"Thought {i}",
-                confidence=1.0
-            )
+        state.scratchpad.extend(
+            Observation(agent="Agent", thought=f"Thought {i}", confidence=1.0)
+            for i in range(10)
+        )
         
         latest = state.get_latest_observations(n=3)
         assert len(latest) == 3
@@ -162,10 +164,8 @@ class TestEnrichedEvent:
     
     def test_create_enriched_event(self):
         """Enriched event wraps a base event."""
-        event = Event(title="Test Event", source="Test")
-        
         enriched = EnrichedEvent(
-            event=event,
+            event=_MINIMAL_EVENT,
             verified=True,
             verification_notes=["URL validated"],
             confidence_score=0.95
@@ -178,10 +178,8 @@ class TestEnrichedEvent:
     
     def test_enriched_metadata(self):
         """Enriched event can have additional metadata."""
-        event = Event(title="Bike Ride", source="Test")
-        
         enriched = EnrichedEvent(
-            event=event,
+            event=_BIKE_EVENT,
             verified=True,
             confidence_score=0.9,
             additional_metadata={"relevance_score": 10}
@@ -196,11 +194,9 @@ class TestSearchAgentResult:
     
     def test_successful_search(self):
         """Search result can represent success."""
-        events = [Event(title="Event 1", source="Test")]
-        
         result = SearchAgentResult(
             agent_name="TestAgent",
-            events=events,
+            events=[_EVENT_1],
             success=True,
             confidence=0.9,
             execution_time_seconds=1.5
@@ -231,9 +227,8 @@ class TestReviewAgentResult:
     
     def test_successful_review(self):
         """Review result includes enriched event."""
-        event = Event(title="Test", source="Test")
         enriched = EnrichedEvent(
-            event=event,
+            event=_MINIMAL_EVENT,
             verified=True,
             confidence_score=0.95
         )
@@ -0,0 +1,84 @@
+"""
+Shared fixtures for the domain model tests.
+"""
+import pytest
+from app.core.domain.research_models import (
+    Entity,
+    ResearchQuery,
+    ResearchResult,
+    EventResearch
+)
+
+
+# Research models are frozen, so one graph per session is safe to share
+@pytest.fixture(scope="session")
+def wynton_research() -> EventResearch:
+    """Full entities -> queries -> results -> synthesis graph for a jazz event."""
+    # Step 1: Extract entities
+    entities = [
+        Entity(name="Wynton Marsalis", type="artist", confidence=0.95),
+        Entity(name="Hobby Center", type="venue", confidence=0.90),
+        Entity(name="Jazz", type="genre", confidence=0.85)
+    ]
+    
+    # Step 2: Generate queries
+    queries = [
+        ResearchQuery(
+            query="What are Wynton Marsalis's major jazz achievements?",
+            priority=10,
+            entity_name="Wynton Marsalis",
+            query_type="awards",
+            executed=False
+        ),
+        ResearchQuery(
+            query="What is the history of Hobby Center in Houston?",
+            priority=8,
+            entity_name="Hobby Center",
+            query_type="venue_history",
+            executed=False
+        ),
+        ResearchQuery(
+            query="What is the cultural impact of jazz in Houston?",
+            priority=7,
+            query_type="cultural_impact",
+            executed=False
+        )
+    ]
+    
+    # Step 3: Execute queries and get results (queries are already validated)
+    queries = [
+        query.model_copy(update={"executed": True, "agent_results": [*query.agent_results, "mock_agent"]})
+        for query in queries
+    ]
+    results = [
+        ResearchResult.model_construct(
+            query=query,
+            agent_id="mock_agent",
+            facts=[
+                f"Mock fact 1 for {query.entity_name or 'unknown'}",
+                f"Mock fact 2 for {query.entity_name or 'unknown'}"
+            ],
+            confidence=0.85,
+            sources=[f"https://mock-source.com/{query.query_type}"]
+        )
+        for query in queries
+    ]
+    
+    # Step 4: Synthesize knowledge
+    return EventResearch(
+        event_title="Jazz At Lincoln Center Orchestra with Wynton Marsalis",
+        entities=entities,
+        queries=queries,
+        results=results,
+        synthesized_narrative=(
+            "Wynton Marsalis, a legendary jazz trumpeter, brings his "
+            "acclaimed Lincoln Center Orchestra to Houston's prestigious "
+            "Hobby Center, celebrating the cultural impact of jazz."
+        ),
+        key_insights=[
+            "Wynton Marsalis has won 9 Grammy Awards",
+            "Hobby Center opened in 2002 as Houston's premier performing arts venue",
+            "Jazz has deep roots in Houston's music culture"
+        ],
+        overall_confidence=0.88
+    )
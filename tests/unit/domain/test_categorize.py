@@ -0,0 +1,104 @@
+"""
+Unit tests for event categorization and scoring.
+
+Pure keyword logic - no I/O or external dependencies.
+"""
+import pytest
+from app.core.domain.categorize import KeywordTagger, categorize
+from app.core.domain.models import Event
+from app.core.domain.services import prioritize_events, score_event
+
+
+@pytest.mark.unit
+class TestCategorize:
+    """Test shared keyword categorization."""
+
+    def test_categorize_title_only(self):
+        """Title keywords alone should be enough to tag an event."""
+        assert categorize("Sunday Bike Ride") == ["cycling"]
+
+    def test_categorize_uses_description(self):
+        """Description keywords should contribute categories."""
+        cats = categorize("Saturday Night", "Live music and craft beer tasting")
+
+        assert "music" in cats
+        assert "food" in cats
+
+    def test_categorize_preserves_category_order(self):
+        """Categories come back in a stable, declared order."""
+        assert categorize("Jazz in the park") == ["outdoor", "music"]
+
+    def test_categorize_folds_ing_forms(self):
+        """Regression: "Running" still tags outdoor, as the old substring match on "run" did."""
+        assert categorize("Houston Running Club 5k", "") == ["outdoor"]
+
+    def test_categorize_folds_al_forms(self):
+        """Regression: "Musical" still tags music alongside the theater match."""
+        assert categorize("Musical theater night", "") == ["music", "arts"]
+
+    def test_categorize_no_match(self):
+        """Unrelated text should yield no categories."""
+        assert categorize("Annual Budget Review") == []
+
+
+@pytest.mark.unit
+class TestKeywordTagger:
+    """Test the word-set keyword matcher."""
+
+    def test_matches_whole_words_only(self):
+        """Keywords no longer match inside longer words."""
+        tagger = KeywordTagger((("music", ["show"]), ("arts", ["art"])))
+
+        assert tagger.tag("showtime at the party") == []
+
+    def test_folds_plurals(self):
+        """A trailing "s" still matches the singular keyword."""
+        tagger = KeywordTagger((("cycling", ["bicycle"]),))
+
+        assert tagger.tag("bicycles for sale") == ["cycling"]
+
+    def test_folds_ing_and_al_forms(self):
+        """-ing (with a doubled consonant or dropped "e") and -al forms match their stems."""
+        tagger = KeywordTagger((("outdoor", ["run", "hike", "walk"]), ("music", ["music"])))
+
+        assert tagger.tag("running") == ["outdoor"]
+        assert tagger.tag("hiking") == ["outdoor"]
+        assert tagger.tag("walking") == ["outdoor"]
+        assert tagger.tag("musical") == ["music"]
+
+    def test_phrases_match_as_substrings(self):
+        """Multi-word keywords are checked against the raw text."""
+        tagger = KeywordTagger((("music", ["live music"]), ("dog-friendly", ["dog-friendly"])))
+
+        assert tagger.tag("dog-friendly patio with live music") == ["music", "dog-friendly"]
+
+    def test_tags_across_several_texts(self):
+        """Matches from every text are unioned, phrases never span texts."""
+        tagger = KeywordTagger((("music", ["live music"]), ("food", ["brunch"])))
+
+        assert tagger.tag("sunday brunch", "live") == ["food"]
+        assert tagger.tag("sunday", "brunch with live music") == ["music", "food"]
+
+
+@pytest.mark.unit
+class TestScoring:
+    """Test priority scoring and ordering."""
+
+    def test_cycling_outranks_kid_events(self):
+        """Cycling events should sort ahead of kid-focused events."""
+        kids = Event(title="Toddler story time")
+        ride = Event(title="Critical Mass bike ride")
+
+        assert prioritize_events([kids, ride]) == [ride, kids]
+
+    def test_score_event_sums_category_weights(self):
+        """Each matching category contributes its weight once."""
+        assert score_event(Event(title="Dog-friendly brewery concert")) == 9 + 8 + 7
+
+    def test_equal_scores_keep_input_order(self):
+        """Ties keep their original relative order."""
+        first = Event(title="Trivia at the brewery")
+        second = Event(title="Wine tasting")
+        ride = Event(title="Bike ride")
+
+        assert prioritize_events([first, second, ride]) == [ride, first, second]
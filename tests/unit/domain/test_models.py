@@ -0,0 +1,36 @@
+"""
+Unit tests for the Event domain model.
+"""
+import pytest
+from app.core.domain.models import Event
+
+
+@pytest.mark.unit
+class TestEvent:
+    """Test derived Event keys."""
+
+    def test_title_key_ignores_case_and_punctuation(self):
+        """Source variants of one title share a de-duplication key."""
+        a = Event(title="Critical Mass - Houston")
+        b = Event(title="critical mass: HOUSTON ")
+
+        assert a.title_key == b.title_key == "critical mass houston"
+
+    def test_model_copy_recomputes_derived_keys(self):
+        """Copies with an updated title don't keep the original's cached keys."""
+        event = Event(title="Critical Mass - Houston")
+        assert event.title_key == "critical mass houston"
+
+        renamed = event.model_copy(update={"title": "Sunday Bike Ride"})
+
+        assert renamed.title_key == "sunday bike ride"
+        assert renamed.search_text == "sunday bike ride "
+        assert event.title_key == "critical mass houston"
+
+    def test_events_are_hashable(self):
+        """Frozen events with equal fields hash equal, so they can go in sets."""
+        a = Event(title="Jazz Night", categories=["music"])
+        b = Event(title="Jazz Night", categories=["music"])
+
+        assert a.categories == ("music",)
+        assert len({a, b}) == 1
@@ -5,7 +5,12 @@ Tests the core research data structures without any I/O or external dependencies
 """
 import pytest
 from datetime import datetime
+from pydantic import ValidationError
 from app.core.domain.research_models import (
+    ALL_ENTITY_TYPES,
+    ALL_QUERY_TYPES,
+    CONFIDENCE_ADAPTER,
+    PRIORITY_ADAPTER,
     Entity,
     ResearchQuery,
     ResearchResult,
@@ -30,27 +35,26 @@ class TestEntity:
         assert entity.type == "artist"
         assert entity.confidence == 0.95
     
-    def test_entity_types(self):
+    @pytest.mark.parametrize("entity_type", sorted(ALL_ENTITY_TYPES))
+    def test_entity_types(self, entity_type):
         """Entity should support all defined types."""
-        valid_types = ["artist", "venue", "organizer", "topic", "genre"]
-        
-        for entity_type in valid_types:
-            entity = Entity(
-                name="Test Entity",
-                type=entity_type,
-                confidence=0.8
-            )
-            assert entity.type == entity_type
+        entity = Entity(
+            name="Test Entity",
+            type=entity_type,
+            confidence=0.8
+        )
+        assert entity.type == entity_type
     
     def test_entity_confidence_bounds(self):
         """Entity confidence should be between 0 and 1."""
-        # Valid confidences
-        Entity(name="Test", type="artist", confidence=0.0)
-        Entity(name="Test", type="artist", confidence=0.5)
-        Entity(name="Test", type="artist", confidence=1.0)
+        # Probe the bounds on the shared constraint itself
+        for confidence in (0.0, 0.5, 1.0):
+            assert CONFIDENCE_ADAPTER.validate_python(confidence) == confidence
+        with pytest.raises(ValidationError):
+            CONFIDENCE_ADAPTER.validate_python(1.5)
         
-        # Invalid confidence should fail validation
-        with pytest.raises(Exception):  # Pydantic ValidationError
+        # Invalid confidence should fail validation on the model too
+        with pytest.raises(ValidationError, match=r"less than or equal to 1"):
             Entity(name="Test", type="artist", confidence=1.5)
 
 
@@ -74,35 +78,38 @@ class TestResearchQuery:
         assert query.executed is False
         assert query.agent_results == []
     
-    def test_all_query_types(self):
+    @pytest.mark.parametrize("query_type", sorted(ALL_QUERY_TYPES))
+    def test_all_query_types(self, query_type):
         """ResearchQuery should support all defined query types."""
-        valid_types = [
-            "biographical", "contextual", "current", "relational",
-            "cultural_impact", "venue_history", "genre_overview",
-            "collaboration", "historical", "awards"
-        ]
-        
-        for query_type in valid_types:
-            query = ResearchQuery(
-                query=f"Test query for {query_type}",
-                priority=5,
-                query_type=query_type
-            )
-            assert query.query_type == query_type
+        query = ResearchQuery(
+            query=f"Test query for {query_type}",
+            priority=5,
+            query_type=query_type
+        )
+        assert query.query_type == query_type
     
     def test_query_priority_bounds(self):
         """Priority should be between 1 and 10."""
-        # Valid priorities
-        ResearchQuery(query="Test", priority=1)
-        ResearchQuery(query="Test", priority=5)
-        ResearchQuery(query="Test", priority=10)
+        # Probe the bounds on the shared constraint itself
+        for priority in (1, 5, 10):
+            assert PRIORITY_ADAPTER.validate_python(priority) == priority
+        for priority in (0, 11):
+            with pytest.raises(ValidationError):
+                PRIORITY_ADAPTER.validate_python(priority)
         
-        # Invalid priorities should fail
-        with pytest.raises(Exception):  # Pydantic ValidationError
+        # Invalid priorities should fail on the model too
+        with pytest.raises(ValidationError, match=r"greater than or equal to 1"):
             ResearchQuery(query="Test", priority=0)
+    
+    def test_query_is_immutable(self):
+        """Queries are frozen; execution state changes through model_copy."""
+        query = ResearchQuery(query="Test query", priority=7)
+        
+        with pytest.raises(ValidationError, match=r"frozen"):
+            query.executed = True
         
-        with pytest.raises(Exception):
-            ResearchQuery(query="Test", priority=11)
+        assert query.model_copy(update={"executed": True}).executed is True
+        assert query.executed is False
     
     def test_query_execution_tracking(self):
         """Query should track execution and agent results."""
@@ -166,7 +173,7 @@ class TestResearchResult:
             sources=[]
         )
         
-        assert len(result.facts) == 0
+        assert not result.facts
         assert result.confidence == 0.0
         assert result.sources == []
 
@@ -264,8 +271,7 @@ class TestEventResearch:
         assert len(research.results) == 2
         assert len(research.key_insights) == 4
         # Total facts = 3 + 2 = 5
-        total_facts = sum(len(r.facts) for r in research.results)
-        assert total_facts == 5
+        assert research.total_facts == 5
     
     def test_empty_event_research(self):
         """EventResearch can have minimal/empty data."""
@@ -279,9 +285,9 @@ class TestEventResearch:
             overall_confidence=0.0
         )
         
-        assert len(research.entities) == 0
-        assert len(research.results) == 0
-        assert len(research.key_insights) == 0
+        assert not research.entities
+        assert not research.results
+        assert not research.key_insights
         assert research.overall_confidence == 0.0
 
 
@@ -289,74 +295,9 @@ class TestEventResearch:
 class TestResearchModelIntegration:
     """Test how research models work together."""
     
-    def test_full_research_workflow(self):
+    def test_full_research_workflow(self, wynton_research):
         """Test a complete research workflow from entities to synthesis."""
-        # Step 1: Extract entities
-        entities = [
-            Entity(name="Wynton Marsalis", type="artist", confidence=0.95),
-            Entity(name="Hobby Center", type="venue", confidence=0.90),
-            Entity(name="Jazz", type="genre", confidence=0.85)
-        ]
-        
-        # Step 2: Generate queries
-        queries = [
-            ResearchQuery(
-                query="What are Wynton Marsalis's major jazz achievements?",
-                priority=10,
-                entity_name="Wynton Marsalis",
-                query_type="awards",
-                executed=False
-            ),
-            ResearchQuery(
-                query="What is the history of Hobby Center in Houston?",
-                priority=8,
-                entity_name="Hobby Center",
-                query_type="venue_history",
-                executed=False
-            ),
-            ResearchQuery(
-                query="What is the cultural impact of jazz in Houston?",
-                priority=7,
-                query_type="cultural_impact",
-                executed=False
-            )
-        ]
-        
-        # Step 3: Execute queries and get results
-        results = []
-        for query in queries:
-            result = ResearchResult(
-                query=query,
-                agent_id="mock_agent",
-                facts=[
-                    f"Mock fact 1 for {query.entity_name or 'unknown'}",
-                    f"Mock fact 2 for {query.entity_name or 'unknown'}"
-                ],
-                confidence=0.85,
-                sources=[f"https://mock-source.com/{query.query_type}"]
-            )
-            results.append(result)
-            query.executed = True
-            query.agent_results.append("mock_agent")
-        
-        # Step 4: Synthesize knowledge
-        research = EventResearch(
-            event_title="Jazz At Lincoln Center Orchestra with Wynton Marsalis",
-            entities=entities,
-            queries=queries,
-            results=results,
-            synthesized_narrative=(
-                "Wynton Marsalis, a legendary jazz trumpeter, brings his "
-                "acclaimed Lincoln Center Orchestra to Houston's prestigious "
-                "Hobby Center, celebrating the cultural impact of jazz."
-            ),
-            key_insights=[
-                "Wynton Marsalis has won 9 Grammy Awards",
-                "Hobby Center opened in 2002 as Houston's premier performing arts venue",
-                "Jazz has deep roots in Houston's music culture"
-            ],
-            overall_confidence=0.88
-        )
+        research = wynton_research
         
         # Verify the complete research
         assert len(research.entities) == 3
@@ -368,3 +309,8 @@ class TestResearchModelIntegration:
         assert "Wynton Marsalis" in research.synthesized_narrative
         assert "Hobby Center" in research.synthesized_narrative
 
+
+    def test_event_research_round_trip(self, wynton_research):
+        """Dumped research validates back into an equal model (no derived fields in the dump)."""
+        assert EventResearch.model_validate(wynton_research.model_dump()) == wynton_research
+        assert EventResearch.model_validate_json(wynton_research.model_dump_json()) == wynton_research